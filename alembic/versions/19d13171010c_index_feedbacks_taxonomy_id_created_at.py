@@ -0,0 +1,28 @@
+"""index feedbacks (taxonomy_id, created_at)
+
+Revision ID: 19d13171010c
+Revises: 8a6f6f2635a2
+Create Date: 2026-10-15 13:47:05.118304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '19d13171010c'
+down_revision: Union[str, Sequence[str], None] = '8a6f6f2635a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_feedbacks_taxonomy_id_created_at', 'feedbacks', ['taxonomy_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_feedbacks_taxonomy_id_created_at', table_name='feedbacks')
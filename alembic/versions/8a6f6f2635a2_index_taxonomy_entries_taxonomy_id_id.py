@@ -0,0 +1,28 @@
+"""index taxonomy_entries (taxonomy_id, id)
+
+Revision ID: 8a6f6f2635a2
+Revises: 0fbd05ffcaad
+Create Date: 2026-10-15 10:12:41.503217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a6f6f2635a2'
+down_revision: Union[str, Sequence[str], None] = '0fbd05ffcaad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_taxonomy_entries_taxonomy_id_id', 'taxonomy_entries', ['taxonomy_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_taxonomy_entries_taxonomy_id_id', table_name='taxonomy_entries')
@@ -1,16 +1,17 @@
+import asyncio
 from fastapi import HTTPException, APIRouter
 from app.schemas.schemas import ChatRequest, ChatResponse
 from app.managers.chatbot_session_manager import chatbot_session_manager
 from app.services import generate_response
-from uuid import uuid4
+import secrets
 
 router = APIRouter(prefix="/chatbot")
 
 @router.post("/generate", response_model=ChatResponse)
 async def generate_text(request: ChatRequest):
     try:
-        session_id = request.session_id if request.session_id else str(uuid4())
-        response_text = generate_response(request.prompt, session_id)
+        session_id = request.session_id if request.session_id else secrets.token_hex(16)
+        response_text = await asyncio.to_thread(generate_response, request.prompt, session_id)
 
         return ChatResponse(text=response_text, session_id=session_id)
     except Exception as e:
@@ -1,7 +1,7 @@
 import logging
-from typing import List, Optional
+from typing import List
 
-from fastapi import APIRouter, Depends, Query as Q
+from fastapi import APIRouter, Depends, Query as Q, Response
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db
@@ -14,6 +14,8 @@ from app.schemas.schemas import (
     FeedbackResponse,
     MessageResponse,
     FeedbackListQuery,
+    FEEDBACK_LIST_ADAPTER,
+    to_dto,
 )
 
 logger = logging.getLogger(__name__)
@@ -28,18 +30,6 @@ def list_feedback(
 ):
     repo = FeedbackRepository(db)
 
-    # taxonomy filter (optional)
-    tax_id: Optional[int] = None
-    if params.taxonomy:
-        t = TaxonomyRepository(db).get_by_taxonomy(params.taxonomy)
-        if not t:
-            logger.info(
-                "List feedback: taxonomy not found",
-                extra={"taxonomy": params.taxonomy},
-            )
-            return []  # keep existing behavior
-        tax_id = t.id
-
     # validate date range if both provided
     if params.date_from and params.date_to and params.date_from > params.date_to:
         logger.warning(
@@ -53,28 +43,32 @@ def list_feedback(
         )
 
     items = repo.list_filtered(
-        taxonomy_id=tax_id,
+        taxonomy_id=None,
+        taxonomy_name=params.taxonomy or None,
         date_from=params.date_from,
         date_to=params.date_to,
         offset=params.offset,
         limit=params.limit,
     )
-    logger.info(
-        "List feedback completed",
-        extra={
-            "taxonomy": params.taxonomy,
-            "date_from": str(params.date_from) if params.date_from else None,
-            "date_to": str(params.date_to) if params.date_to else None,
-            "returned": len(items),
-        },
-    )
-    return [FeedbackResponse.model_validate(it, from_attributes=True) for it in items]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "List feedback completed",
+            extra={
+                "taxonomy": params.taxonomy,
+                "date_from": str(params.date_from) if params.date_from else None,
+                "date_to": str(params.date_to) if params.date_to else None,
+                "returned": len(items),
+            },
+        )
+    # serialized in one pass; returning a Response skips FastAPI's per-item response_model walk
+    body = FEEDBACK_LIST_ADAPTER.dump_json([to_dto(FeedbackResponse, o) for o in items])
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("", response_model=FeedbackResponse)
 def create_feedback(payload: FeedbackCreateRequest, db: Session = Depends(get_db)):
-    tax = TaxonomyRepository(db).get_by_taxonomy(payload.taxonomy)
-    if not tax:
+    tax_id = TaxonomyRepository(db).get_id_by_taxonomy(payload.taxonomy)
+    if tax_id is None:
         logger.warning(
             "Create feedback: unknown taxonomy",
             extra={"taxonomy": payload.taxonomy},
@@ -88,7 +82,7 @@ def create_feedback(payload: FeedbackCreateRequest, db: Session = Depends(get_db
     try:
         repo = FeedbackRepository(db)
         obj = repo.create(
-            taxonomy_id=tax.id,
+            taxonomy_id=tax_id,
             query=payload.query,
             reference=payload.reference,
             tag=payload.tag,
@@ -98,11 +92,12 @@ def create_feedback(payload: FeedbackCreateRequest, db: Session = Depends(get_db
         )
         db.commit()
         db.refresh(obj)  # ensure created_at/defaults populated
-        logger.info(
-            "Feedback created",
-            extra={"feedback_id": obj.id, "taxonomy": payload.taxonomy},
-        )
-        return FeedbackResponse.model_validate(obj, from_attributes=True)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Feedback created",
+                extra={"feedback_id": obj.id, "taxonomy": payload.taxonomy},
+            )
+        return to_dto(FeedbackResponse, obj)
     except Exception:
         db.rollback()
         logger.error(
@@ -133,8 +128,9 @@ def update_feedback(payload: FeedbackUpdateRequest, db: Session = Depends(get_db
         )
         db.commit()
         db.refresh(updated)
-        logger.info("Feedback updated", extra={"feedback_id": payload.id})
-        return FeedbackResponse.model_validate(updated, from_attributes=True)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Feedback updated", extra={"feedback_id": payload.id})
+        return to_dto(FeedbackResponse, updated)
     except Exception:
         db.rollback()
         logger.error("Failed to update feedback", extra={"feedback_id": payload.id}, exc_info=True)
@@ -152,7 +148,8 @@ def delete_feedback(id: int = Q(..., description="feedback id"), db: Session = D
     try:
         repo.delete(obj)
         db.commit()
-        logger.info("Feedback deleted", extra={"feedback_id": id})
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Feedback deleted", extra={"feedback_id": id})
         return MessageResponse(message="Deleted.")
     except Exception:
         db.rollback()
@@ -1,7 +1,10 @@
-import uuid
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from app.core.deps import get_registry, get_jobs_manager
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from app.core.deps import get_registry, get_jobs_manager, get_vectorstore_service
 from app.core.errors import AppException, ErrorCode
+from app.core.http_cache import is_not_modified
 from app.core.index_cache import index_cache
 from app.schemas.schemas import CacheStatsResponse, BuildIndexRequest, FineTuneEmbedderRequest, FineTuneRerankerRequest
 from app.services import build_index_async, finetune_reranker_async, finetune_embedder_async
@@ -11,30 +14,29 @@ router = APIRouter()
 @router.post("/build_index")
 def build_index(
     req: BuildIndexRequest,
-    background_tasks: BackgroundTasks,
     registry = Depends(get_registry),
     jobs = Depends(get_jobs_manager),
+    vectorstore = Depends(get_vectorstore_service),
 ):
     if not req.taxonomy:
         raise AppException(ErrorCode.VALIDATION_ERROR, "taxonomy is required", status_code=422)
     if not registry or not registry.embedder:
         raise AppException(ErrorCode.MODEL_NOT_LOADED, "Active embedder not loaded", status_code=500)
 
-    # Prevent duplicate concurrent builds for the same taxonomy
-    active = jobs.find_active_for_taxonomy(req.taxonomy)
+    # Prevent duplicate concurrent builds for the same taxonomy; check and create happen under one lock
+    job_id = secrets.token_hex(16)
+    active = jobs.set_unless_active(
+        job_id, {"status": "queued", "progress": 0, "total": 0, "done": 0, "taxonomy": req.taxonomy}
+    )
     if active:
         jid, state = active
         return {"message": "Build already running", "job_id": jid, "status": state["status"]}
 
-    job_id = str(uuid.uuid4())
-    jobs.set(job_id, {"status": "queued", "progress": 0, "total": 0, "done": 0, "taxonomy": req.taxonomy})
-
-    background_tasks.add_task(build_index_async, job_id, req.taxonomy, registry, jobs)
+    jobs.submit(build_index_async, job_id, req.taxonomy, registry, jobs, vectorstore)
     return {"message": "Index build started", "job_id": job_id}
 
 @router.post("/finetune_embedder")
 def finetune_embedder(
-    background_tasks: BackgroundTasks,
     req: FineTuneEmbedderRequest,
     jobs = Depends(get_jobs_manager),
 ):
@@ -42,7 +44,7 @@ def finetune_embedder(
     if not req.embedder_id:
         raise AppException(ErrorCode.VALIDATION_ERROR, "embedder_id is required", status_code=422)
 
-    job_id = str(uuid.uuid4())
+    job_id = secrets.token_hex(16)
     job_payload = {
         "status": "queued",
         "progress": 0,
@@ -53,16 +55,19 @@ def finetune_embedder(
         "feedback_date_to": req.date_to,
     }
 
-    jobs.set(job_id, job_payload)
+    # Coalesce identical submissions instead of running the same finetune twice
+    active = jobs.set_unless_active(job_id, job_payload)
+    if active:
+        jid, state = active
+        return {"message": "Finetuning already running", "job_id": jid, "status": state["status"]}
 
-    # Add the task to background to perform finetuning
-    background_tasks.add_task(finetune_embedder_async, job_id, req.embedder_id, req.date_from, req.date_to, jobs)
+    # Hand the finetuning off to the jobs executor
+    jobs.submit(finetune_embedder_async, job_id, req.embedder_id, req.date_from, req.date_to, jobs)
 
     return {"message": "Finetuning for embedder started", "job_id": job_id}
 
 @router.post("/finetune_reranker")
 def finetune_reranker(
-    background_tasks: BackgroundTasks,
     req: FineTuneRerankerRequest,
     jobs = Depends(get_jobs_manager),
 ):
@@ -70,7 +75,7 @@ def finetune_reranker(
     if not req.reranker_id:
         raise AppException(ErrorCode.VALIDATION_ERROR, "reranker_id is required", status_code=422)
 
-    job_id = str(uuid.uuid4())
+    job_id = secrets.token_hex(16)
     job_payload = {
         "status": "queued",
         "progress": 0,
@@ -81,28 +86,49 @@ def finetune_reranker(
         "feedback_date_to": req.date_to,
     }
 
-    jobs.set(job_id, job_payload)
+    # Coalesce identical submissions instead of running the same finetune twice
+    active = jobs.set_unless_active(job_id, job_payload)
+    if active:
+        jid, state = active
+        return {"message": "Finetuning already running", "job_id": jid, "status": state["status"]}
 
-    background_tasks.add_task(finetune_reranker_async, job_id, req.reranker_id, req.date_from, req.date_to, jobs)
+    jobs.submit(finetune_reranker_async, job_id, req.reranker_id, req.date_from, req.date_to, jobs)
 
     return {"message": "Finetuning for reranker started", "job_id": job_id}
 
 @router.get("/status/all")
-def get_jobs(jobs = Depends(get_jobs_manager)):
-    return jobs.all()
+async def get_jobs(request: Request, jobs = Depends(get_jobs_manager)):
+    # read the version before the snapshot so the ETag never claims newer data than the body
+    etag = f'W/"{jobs.version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    # job states are plain JSON-native values; returning the response skips jsonable_encoder
+    return ORJSONResponse(jobs.all(), headers=headers)
 
 @router.get("/status/{job_id}")
-def get_status(job_id: str, jobs = Depends(get_jobs_manager)):
+async def get_status(job_id: str, jobs = Depends(get_jobs_manager)):
     data = jobs.get(job_id)
     if not data:
         return {"error": "Job not found"}
-    return data
+    return ORJSONResponse(data)
+
+@router.get("/status/{job_id}/wait")
+async def wait_status(
+    job_id: str,
+    status: Optional[str] = None,
+    timeout: float = Query(30, gt=0, le=60),
+    jobs = Depends(get_jobs_manager),
+):
+    # Long-poll: returns as soon as the job's status changes (or differs from `status`)
+    data = await jobs.wait_for_status_change(job_id, status, timeout)
+    if not data:
+        return {"error": "Job not found"}
+    return ORJSONResponse(data)
 
 @router.get("/index_cache/stats", response_model=CacheStatsResponse)
 def get_cache_stats():
     try:
-        stats = index_cache.get_stats()
-        stats["index_path"] = str(stats["index_path"])
-        return CacheStatsResponse(**stats)
+        return CacheStatsResponse(**index_cache.get_stats())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get cache stats: {str(e)}")
@@ -1,11 +1,13 @@
 import logging
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db, get_registry, get_vectorstore_service
+from app.core.deps import get_db, get_current_setting, get_registry, get_vectorstore_service
 from app.core.errors import AppException, ErrorCode
+from app.models.entities import Setting
 from app.repositories.setting import SettingRepository
 from app.services.embedder_service import EmbedderService
 from app.services.reranker_service import RerankerService
@@ -15,24 +17,31 @@ from app.schemas.schemas import (
     MessageResponse,
     EmbedderResponse,
     RerankerResponse,
+    EMBEDDER_LIST_ADAPTER,
+    RERANKER_LIST_ADAPTER,
+    to_dto,
 )
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _active_models_response(s: Optional[Setting]) -> ORJSONResponse:
+    # returning a Response skips FastAPI's second validation pass against response_model
+    return ORJSONResponse({
+        "active_embedder": to_dto(EmbedderResponse, s.embedder).model_dump(mode="json") if s and s.embedder else None,
+        "active_reranker": to_dto(RerankerResponse, s.reranker).model_dump(mode="json") if s and s.reranker else None,
+    })
+
+
 @router.get("/active_models", response_model=ActiveModelsResponse)
-def get_active_models(db: Session = Depends(get_db)):
+def get_active_models(s: Optional[Setting] = Depends(get_current_setting)):
     try:
-        s = SettingRepository(db).get_current()
         logger.info("Fetched active models", extra={
             "has_embedder": bool(s and s.embedder),
             "has_reranker": bool(s and s.reranker),
         })
-        return ActiveModelsResponse(
-            active_embedder=EmbedderResponse.model_validate(s.embedder, from_attributes=True) if s and s.embedder else None,
-            active_reranker=RerankerResponse.model_validate(s.reranker, from_attributes=True) if s and s.reranker else None,
-        )
+        return _active_models_response(s)
     except Exception as e:
         logger.error("Failed to fetch active models", exc_info=True)
         raise AppException(ErrorCode.INTERNAL_SERVER_ERROR, str(e), status_code=500)
@@ -46,17 +55,13 @@ def update_active_models(payload: UpdateSettingsRequest, db: Session = Depends(g
             "active_embedder_id": payload.active_embedder_id,
             "active_reranker_id": payload.active_reranker_id,
         })
-        repo.set_active(embedder_id=payload.active_embedder_id, reranker_id=payload.active_reranker_id)
+        s = repo.set_active(embedder_id=payload.active_embedder_id, reranker_id=payload.active_reranker_id)
         db.commit()
-        s = repo.get_current()
         logger.info("Updated active models", extra={
             "has_embedder": bool(s and s.embedder),
             "has_reranker": bool(s and s.reranker),
         })
-        return ActiveModelsResponse(
-            active_embedder=EmbedderResponse.model_validate(s.embedder, from_attributes=True) if s and s.embedder else None,
-            active_reranker=RerankerResponse.model_validate(s.reranker, from_attributes=True) if s and s.reranker else None,
-        )
+        return _active_models_response(s)
     except Exception as e:
         db.rollback()
         logger.error("Failed to update active models", exc_info=True)
@@ -86,7 +91,8 @@ def list_embedders(db: Session = Depends(get_db)):
     try:
         items = EmbedderService(db).list()
         logger.info("Listed embedders", extra={"count": len(items)})
-        return [EmbedderResponse.model_validate(x, from_attributes=True) for x in items]
+        body = EMBEDDER_LIST_ADAPTER.dump_json([to_dto(EmbedderResponse, o) for o in items])
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error("Failed to list embedders", exc_info=True)
         raise AppException(ErrorCode.INTERNAL_SERVER_ERROR, str(e), status_code=500)
@@ -97,7 +103,8 @@ def list_rerankers(db: Session = Depends(get_db)):
     try:
         items = RerankerService(db).list()
         logger.info("Listed rerankers", extra={"count": len(items)})
-        return [RerankerResponse.model_validate(x, from_attributes=True) for x in items]
+        body = RERANKER_LIST_ADAPTER.dump_json([to_dto(RerankerResponse, o) for o in items])
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error("Failed to list rerankers", exc_info=True)
         raise AppException(ErrorCode.INTERNAL_SERVER_ERROR, str(e), status_code=500)
@@ -105,7 +112,7 @@ def list_rerankers(db: Session = Depends(get_db)):
 
 @router.delete("/embedders/{id}", response_model=MessageResponse)
 def delete_embedder(id: int, db: Session = Depends(get_db)):
-    setting = SettingRepository(db).get_current()
+    setting = SettingRepository(db).get_current_active_ids()
     if setting and setting.active_embedder_id == id:
         logger.warning("Attempted to delete active embedder", extra={"embedder_id": id})
         raise AppException(ErrorCode.VALIDATION_ERROR, "Cannot delete the active embedder.", status_code=409)
@@ -125,7 +132,7 @@ def delete_embedder(id: int, db: Session = Depends(get_db)):
 
 @router.delete("/rerankers/{id}", response_model=MessageResponse)
 def delete_reranker(id: int, db: Session = Depends(get_db)):
-    setting = SettingRepository(db).get_current()
+    setting = SettingRepository(db).get_current_active_ids()
     if setting and setting.active_reranker_id == id:
         logger.warning("Attempted to delete active reranker", extra={"reranker_id": id})
         raise AppException(ErrorCode.VALIDATION_ERROR, "Cannot delete the active reranker.", status_code=409)
@@ -1,18 +1,24 @@
+import asyncio
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
 from app.core.deps import get_registry, get_vectorstore_service
 from app.core.errors import AppException, ErrorCode
-from app.schemas.schemas import QueryRequest, QueryResponse, QueryResult
+from app.schemas.schemas import QueryRequest, QueryResponse
 
 router = APIRouter()
 
 @router.post("/query", response_model=QueryResponse)
-def query(
+async def query(
     req: QueryRequest,
     registry = Depends(get_registry),
     vectorstore = Depends(get_vectorstore_service),
 ):
     if not registry.embedder:
         raise AppException(ErrorCode.MODEL_NOT_LOADED, "Active embedder not loaded", status_code=500)
-    q, tax, results = vectorstore.query(req, registry)
-    return QueryResponse(query=q, taxonomy=tax, results=[QueryResult(**r) for r in results])
\ No newline at end of file
+    # FAISS search and reranking are CPU-bound; keep them off the event loop
+    q, tax, results = await asyncio.to_thread(vectorstore.query, req, registry)
+    # results are built by VectorstoreService with the exact QueryResult shape; returning the
+    # response directly skips both model construction and FastAPI's response_model pass
+    return ORJSONResponse({"query": q, "taxonomy": tax, "results": results})
\ No newline at end of file
@@ -1,37 +1,68 @@
-from typing import List
-
-from fastapi import APIRouter, Depends, UploadFile, File
-from sqlalchemy.orm import Session
-
-from app.core.deps import get_db
+import asyncio
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+
+from app.core.config import get_config
+from app.core.deps import get_taxonomy_service, get_vectorstore_service
+from app.core.http_cache import conditional_json_response
 from app.core.index_cache import index_cache
 from app.core.errors import AppException, ErrorCode
-from app.repositories.taxonomy import TaxonomyRepository
-from app.repositories.taxonomy_entry import TaxonomyEntryRepository
 from app.services.taxonomy_service import TaxonomyService
+from app.utils import get_parse_pool, parse_excel_rows
 from app.schemas.schemas import (
     TaxonomyResponse,
+    TaxonomyBatchRequest,
     TaxonomyEntryResponse,
     AddEntryRequest,
     UpdateEntryRequest,
     UploadTaxonomyResponse,
     UploadTaxonomyRequest,
     MessageResponse,
+    TAXONOMY_LIST_ADAPTER,
+    TAXONOMY_ENTRY_LIST_ADAPTER,
+    TAXONOMY_ENTRY_GROUPS_ADAPTER,
+    to_dto,
 )
 
 router = APIRouter(prefix="/taxonomy")
 
+_PARSE_WORKERS = get_config().EXCEL_PARSE_WORKERS
+
+
+def _spool_to_path(src) -> str:
+    # chunked copy of the spooled upload; the workbook is never held in memory as one bytes object
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+        shutil.copyfileobj(src, tmp)
+    return tmp.name
+
+
 @router.post("/upload", response_model=UploadTaxonomyResponse)
 async def upload_taxonomy(
     file: UploadFile = File(),
     meta: UploadTaxonomyRequest = Depends(),
-    db: Session = Depends(get_db),
+    svc: TaxonomyService = Depends(get_taxonomy_service),
 ):
+    path = None
     try:
-        data = await file.read()
-        svc = TaxonomyService(db)
-        taxonomy_id = svc.upload_taxonomy(
-            file_contents=data,
+        # Parsing is CPU-bound pure Python that holds the GIL; run it in a worker process
+        # so it stalls neither the event loop nor concurrent requests. The worker reads the
+        # workbook from a temp file path, so only the path crosses the process boundary.
+        path = await run_in_threadpool(_spool_to_path, file.file)
+        if _PARSE_WORKERS > 0:
+            loop = asyncio.get_running_loop()
+            rows = await loop.run_in_executor(get_parse_pool(_PARSE_WORKERS), parse_excel_rows, path, meta.sheet_name)
+        else:
+            rows = await run_in_threadpool(parse_excel_rows, path, meta.sheet_name)
+
+        taxonomy_id = await run_in_threadpool(
+            svc.upload_taxonomy,
+            rows=rows,
             filename=file.filename,
             sheet_name=meta.sheet_name,
             taxonomy=meta.taxonomy,
@@ -44,65 +75,105 @@ async def upload_taxonomy(
             f"Failed to process taxonomy upload: {e}",
             status_code=500,
         )
+    finally:
+        if path is not None:
+            os.unlink(path)
 
 
 @router.get("/list", response_model=List[TaxonomyResponse])
-def list_taxonomies(db: Session = Depends(get_db)):
-    items = TaxonomyRepository(db).list()
-    return [TaxonomyResponse.model_validate(x, from_attributes=True) for x in items]
+def list_taxonomies(svc: TaxonomyService = Depends(get_taxonomy_service)):
+    # rows already have the TaxonomyResponse columns; serialize them as-is
+    return ORJSONResponse(svc.list_rows())
+
+
+@router.post("/batch", response_model=List[TaxonomyResponse])
+def get_taxonomies_batch(payload: TaxonomyBatchRequest, svc: TaxonomyService = Depends(get_taxonomy_service)):
+    items = svc.list_by_ids(payload.ids)
+    body = TAXONOMY_LIST_ADAPTER.dump_json([to_dto(TaxonomyResponse, o) for o in items])
+    return Response(content=body, media_type="application/json")
+
+
+# Declared before /{taxonomy_id} so "entries" is not parsed as an id
+@router.get("/entries", response_model=Dict[int, List[TaxonomyEntryResponse]])
+def get_entries_batch(
+    ids: str = Query(..., description="Comma-separated taxonomy ids"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(200, gt=0, le=1000),
+    svc: TaxonomyService = Depends(get_taxonomy_service),
+):
+    try:
+        taxonomy_ids = list(dict.fromkeys(int(x) for x in ids.split(",") if x.strip()))
+    except ValueError:
+        raise AppException(ErrorCode.VALIDATION_ERROR, "ids must be comma-separated integers", status_code=422)
+    if not taxonomy_ids or len(taxonomy_ids) > 500:
+        raise AppException(ErrorCode.VALIDATION_ERROR, "ids must contain between 1 and 500 taxonomy ids", status_code=422)
+
+    grouped: Dict[int, list] = {tid: [] for tid in taxonomy_ids}
+    for e in svc.get_entries_for_taxonomies(taxonomy_ids, offset=offset, limit=limit):
+        grouped[e.taxonomy_id].append(to_dto(TaxonomyEntryResponse, e))
+    return Response(content=TAXONOMY_ENTRY_GROUPS_ADAPTER.dump_json(grouped), media_type="application/json")
 
 
 @router.get("/{taxonomy_id}", response_model=TaxonomyResponse)
-def get_taxonomy(taxonomy_id: int, db: Session = Depends(get_db)):
-    t = TaxonomyService(db).get(taxonomy_id)
-    return TaxonomyResponse.model_validate(t, from_attributes=True)
+def get_taxonomy(taxonomy_id: int, request: Request, svc: TaxonomyService = Depends(get_taxonomy_service)):
+    t = svc.get(taxonomy_id)
+    body = to_dto(TaxonomyResponse, t).model_dump_json().encode()
+    return conditional_json_response(request, body)
 
 
 @router.delete("/{taxonomy_id}", response_model=MessageResponse)
-def delete_taxonomy(taxonomy_id: int, db: Session = Depends(get_db)):
-    repo = TaxonomyRepository(db)
-    t = repo.get(taxonomy_id)
-    if not t:
-        raise AppException(ErrorCode.NOT_FOUND, "Taxonomy not found", status_code=404)
-    taxonomy_key = t.taxonomy
-    TaxonomyService(db).delete(id)
+def delete_taxonomy(
+    taxonomy_id: int,
+    svc: TaxonomyService = Depends(get_taxonomy_service),
+    vectorstore = Depends(get_vectorstore_service),
+):
+    taxonomy_key = svc.delete(taxonomy_id)
     index_cache.remove(taxonomy_key, from_disk=True)
+    vectorstore.evict_cached_results(taxonomy_key)
     return MessageResponse(message="Deleted (with cascade).")
 
 
 @router.get("/{taxonomy_id}/entries", response_model=List[TaxonomyEntryResponse])
-def get_taxonomy_entries(taxonomy_id: int, offset: int = 0, limit: int = 200, db: Session = Depends(get_db)):
-    entries = TaxonomyService(db).get_entries(taxonomy_id)[offset: offset + limit]
-    return [TaxonomyEntryResponse.model_validate(x, from_attributes=True) for x in entries]
+def get_taxonomy_entries(
+    taxonomy_id: int,
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(200, gt=0, le=1000),
+    after_id: Optional[int] = Query(None, ge=0, description="Return entries after this id (keyset paging; overrides offset)"),
+    svc: TaxonomyService = Depends(get_taxonomy_service),
+):
+    entries = svc.get_entries(taxonomy_id, offset=offset, limit=limit, after_id=after_id)
+    body = TAXONOMY_ENTRY_LIST_ADAPTER.dump_json([TaxonomyEntryResponse.model_construct(**e) for e in entries])
+    response = conditional_json_response(request, body)
+    if entries:
+        response.headers["X-Next-After"] = str(entries[-1]["id"])
+    return response
 
 
 @router.post("/entries", response_model=TaxonomyEntryResponse)
-def add_entry(payload: AddEntryRequest, db: Session = Depends(get_db)):
-    e = TaxonomyService(db).add_entry(
+def add_entry(payload: AddEntryRequest, svc: TaxonomyService = Depends(get_taxonomy_service)):
+    e = svc.add_entry(
         taxonomy_id=payload.taxonomy_id,
         tag=payload.tag,
         datatype=payload.datatype,
         reference=payload.reference,
     )
-    return TaxonomyEntryResponse.model_validate(e, from_attributes=True)
+    return to_dto(TaxonomyEntryResponse, e)
 
 
 @router.patch("/entries/{entry_id}", response_model=TaxonomyEntryResponse)
-def update_entry(entry_id: int, payload: UpdateEntryRequest, db: Session = Depends(get_db)):
-    entry_repo = TaxonomyEntryRepository(db)
-    current = entry_repo.get(entry_id)
-    if not current:
-        raise AppException(ErrorCode.NOT_FOUND, "Entry not found", status_code=404)
-    e = TaxonomyService(db).update_entry(
+def update_entry(entry_id: int, payload: UpdateEntryRequest, svc: TaxonomyService = Depends(get_taxonomy_service)):
+    current = svc.get_entry(entry_id)
+    e = svc.update_entry(
         entry_id=entry_id,
         tag=payload.tag if payload.tag is not None else current.tag,
         datatype=payload.datatype if payload.datatype is not None else current.datatype,
         reference=payload.reference if payload.reference is not None else current.reference,
     )
-    return TaxonomyEntryResponse.model_validate(e, from_attributes=True)
+    return to_dto(TaxonomyEntryResponse, e)
 
 
 @router.delete("/entries/{entry_id}", response_model=MessageResponse)
-def delete_entry(entry_id: int, db: Session = Depends(get_db)):
-    TaxonomyService(db).delete_entry(entry_id)
+def delete_entry(entry_id: int, svc: TaxonomyService = Depends(get_taxonomy_service)):
+    svc.delete_entry(entry_id)
     return MessageResponse(message="Deleted.")
\ No newline at end of file
@@ -15,16 +15,43 @@ class Config(BaseSettings):
     APP_ENV: str = Field("development", env="APP_ENV")
     API_PREFIX: str = Field("/api/v1", env="API_PREFIX")
     DEBUG: bool = Field(True, env="DEBUG")
+    # Turn off when migrations run as a separate step (`python -m app.db.migrate`)
+    RUN_MIGRATIONS_ON_STARTUP: bool = Field(True, env="RUN_MIGRATIONS_ON_STARTUP")
+    LOG_LEVEL: str = Field("INFO", env="LOG_LEVEL")
     HF_TOKEN: str = Field(..., env="HF_TOKEN")
 
     DEVICE: str = Field("cpu", env="DEVICE")
 
+    # Background jobs (index builds, finetuning)
+    JOBS_MAX_WORKERS: int = Field(2, env="JOBS_MAX_WORKERS")
+    # Worker processes for parsing uploaded Excel files (0 parses in a thread instead)
+    EXCEL_PARSE_WORKERS: int = Field(2, env="EXCEL_PARSE_WORKERS")
+
+    # Semantic query cache (per taxonomy bucket size; 0 disables)
+    SEMANTIC_CACHE_SIZE: int = Field(1024, env="SEMANTIC_CACHE_SIZE")
+    SEMANTIC_CACHE_THRESHOLD: float = Field(0.97, env="SEMANTIC_CACHE_THRESHOLD")
+
+    # Micro-batching of concurrent query embeddings (max batch 1 disables it)
+    EMBED_BATCH_MAX: int = Field(32, env="EMBED_BATCH_MAX")
+    EMBED_BATCH_WAIT_MS: float = Field(0.0, env="EMBED_BATCH_WAIT_MS")
+
+    # Store built indices as 8-bit scalar-quantized vectors (~4x smaller, approximate distances)
+    QUANTIZE_INDEX: bool = Field(False, env="QUANTIZE_INDEX")
+    # OpenMP threads per FAISS call; requests already run concurrently, so don't fan out inside each one
+    FAISS_NUM_THREADS: int = Field(1, env="FAISS_NUM_THREADS")
+    # Map index files read-only instead of copying them into memory
+    INDEX_MMAP: bool = Field(False, env="INDEX_MMAP")
+
     # Database variables
     DB_USER: str = Field(..., env="DB_USER")
     DB_PASSWORD: str = Field(..., env="DB_PASSWORD")
     DB_HOST: str = Field(..., env="DB_HOST")
     DB_PORT: int = Field(5432, env="DB_PORT")
     DB_NAME: str = Field(..., env="DB_NAME")
+    DB_POOL_SIZE: int = Field(20, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(40, env="DB_MAX_OVERFLOW")
+    DB_POOL_RECYCLE: int = Field(1800, env="DB_POOL_RECYCLE")
+    DB_STATEMENT_TIMEOUT_MS: int = Field(30000, env="DB_STATEMENT_TIMEOUT_MS")
 
     # Cloud Storage volume mount path for models (explicit mounted path)
     MOUNTED_STORAGE_PATH: Path = Field(Path("/mnt/data"), env="MOUNTED_STORAGE_PATH")
@@ -1,7 +1,10 @@
-from typing import Generator
-from fastapi import Request
+from typing import Generator, Optional
+from fastapi import Depends, Request
+from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
-from app.services import ModelRegistry
+from app.models.entities import Setting
+from app.repositories.setting import SettingRepository
+from app.services import ModelRegistry, TaxonomyService
 from app.services import VectorstoreService
 from app.managers.jobs_manager import JobsManager
 
@@ -14,13 +17,22 @@ def get_db() -> Generator:
         db.close()
 
 
-def get_registry(request: Request) -> ModelRegistry:
+def get_current_setting(db: Session = Depends(get_db)) -> Optional[Setting]:
+    # FastAPI caches dependency results per request, so this runs at most once
+    return SettingRepository(db).get_current()
+
+
+def get_taxonomy_service(db: Session = Depends(get_db)) -> TaxonomyService:
+    return TaxonomyService(db)
+
+
+async def get_registry(request: Request) -> ModelRegistry:
     return request.app.state.registry
 
 
-def get_vectorstore_service(request: Request) -> VectorstoreService:
+async def get_vectorstore_service(request: Request) -> VectorstoreService:
     return request.app.state.vectorstore_service
 
 
-def get_jobs_manager(request: Request) -> JobsManager:
+async def get_jobs_manager(request: Request) -> JobsManager:
     return request.app.state.jobs_manager
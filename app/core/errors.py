@@ -4,13 +4,15 @@ from enum import Enum
 from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.exc import SQLAlchemyError
 
 from .config import get_config
 
+_IS_DEV = get_config().is_development
+
 
 class ErrorCode(str, Enum):
     VALIDATION_ERROR = "VALIDATION_ERROR"
@@ -34,9 +36,12 @@ class AppException(Exception):
         self.status_code = status_code
         self.detail = detail
 
+    def __reduce__(self):
+        # default Exception pickling replays only args=(message,); keep all fields across process boundaries
+        return (self.__class__, (self.code, self.message, self.status_code, self.detail))
+
 
 def _error_payload(code: ErrorCode, message: str, request_id: str, status_code: int, detail: Any = None):
-    config = get_config()
     payload: Dict[str, Any] = {
         "error": {
             "id": str(uuid.uuid4()),
@@ -45,10 +50,10 @@ def _error_payload(code: ErrorCode, message: str, request_id: str, status_code:
         },
         "meta": {"request_id": request_id},
     }
-    if config.is_development:
+    if _IS_DEV:
         payload["error"]["detail"] = detail
         payload["error"]["stack"] = traceback.format_exc().splitlines()
-    return JSONResponse(status_code=status_code, content=payload)
+    return ORJSONResponse(status_code=status_code, content=payload)
 
 
 def configure_exception_handlers(app: FastAPI):
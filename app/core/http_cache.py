@@ -0,0 +1,29 @@
+import hashlib
+
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, max-age=30, stale-while-revalidate=60"
+
+
+def _etag_for(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    return _matches(request.headers.get("if-none-match"), etag)
+
+
+def conditional_json_response(request: Request, body: bytes, cache_control: str = CACHE_CONTROL) -> Response:
+    """Serve a pre-serialized JSON body with a weak ETag, or 304 if the client already has it"""
+    etag = _etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,17 +1,38 @@
+import itertools
 import os
+import pickle
 import shutil
+import faiss
+from threading import Lock
 from typing import List, Dict, Optional, Any
 from pathlib import Path
+from cachetools import TTLCache
 from langchain.schema import Document
 from langchain_community.vectorstores import FAISS
 from app.core.config import get_config
 from app.core.errors import AppException, ErrorCode
 
+# monitoring pings tend to come in bursts; one directory scan serves them all
+_STATS_TTL = 2.0
+
+# IO_FLAG_MMAP alone only maps IVF lists; flat indices need IO_FLAG_MMAP_IFC (faiss >= 1.10)
+_MMAP_FLAGS = faiss.IO_FLAG_MMAP | getattr(faiss, "IO_FLAG_MMAP_IFC", 0) | faiss.IO_FLAG_READ_ONLY
+
+# process-wide counter, so a version is never handed out twice even across remove/re-add
+_INDEX_VERSIONS = itertools.count(1)
+
 
 class IndexCache:    
     def __init__(self):
         self._cache: Dict[str, FAISS] = {}
         self._config = get_config()
+        self._stats: TTLCache = TTLCache(maxsize=1, ttl=_STATS_TTL)
+        self._stats_lock = Lock()
+        # index dir name -> has index.faiss; rescanned when the index root's mtime changes
+        self._disk: Optional[Dict[str, bool]] = None
+        self._disk_mtime_ns: Optional[int] = None
+        # taxonomy -> version of its cached index; changes whenever that index is replaced or modified
+        self._versions: Dict[str, int] = {}
         
     
     @property
@@ -23,10 +44,29 @@ class IndexCache:
     @property
     def disk_indices(self) -> List[str]:
         """Get all index names stored on disk"""
+        return list(self._disk_entries())
+    
+    
+    def _disk_entries(self) -> Dict[str, bool]:
         index_dir = Path(self._config.index_path)
-        if not index_dir.exists():
-            return []
-        return [d.name for d in index_dir.iterdir() if d.is_dir()]
+        try:
+            mtime_ns = index_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._disk, self._disk_mtime_ns = {}, None
+            return self._disk
+        if self._disk is None or mtime_ns != self._disk_mtime_ns:
+            with os.scandir(index_dir) as it:
+                names = [e.name for e in it if e.is_dir()]
+            for name in names:
+                if name.startswith(".") and name.endswith(".old"):
+                    self._restore_interrupted_swap(name[1:-len(".old")])
+            with os.scandir(index_dir) as it:
+                self._disk = {
+                    e.name: os.path.exists(os.path.join(e.path, "index.faiss"))
+                    for e in it if e.is_dir() and not e.name.startswith(".")
+                }
+            self._disk_mtime_ns = index_dir.stat().st_mtime_ns
+        return self._disk
     
     
     def get(self, taxonomy: str, embeddings=None) -> Optional[FAISS]:
@@ -45,9 +85,20 @@ class IndexCache:
         return None
     
     
+    def version(self, taxonomy: str) -> int:
+        """Version of the cached index for `taxonomy` (0 if none is cached)"""
+        return self._versions.get(taxonomy, 0)
+    
+    
+    def _bump(self, taxonomy: str) -> None:
+        self._versions[taxonomy] = next(_INDEX_VERSIONS)
+    
+    
     def set(self, taxonomy: str, index: FAISS) -> None:
         """Add or update index in cache"""
         self._cache[taxonomy] = index
+        self._bump(taxonomy)
+        self._invalidate_stats()
     
     
     def load(self, taxonomy: str, embeddings, force_reload: bool = False) -> FAISS:
@@ -56,6 +107,7 @@ class IndexCache:
             return self._cache[taxonomy]
         
         index_path = Path(self._config.index_path) / taxonomy
+        self._restore_interrupted_swap(taxonomy)
         if not index_path.exists():
             raise AppException(
                 ErrorCode.INDEX_NOT_FOUND,
@@ -64,12 +116,17 @@ class IndexCache:
             )
         
         try:
-            vs = FAISS.load_local(
-                str(index_path), 
-                embeddings, 
-                allow_dangerous_deserialization=True
-            )
+            if self._config.INDEX_MMAP:
+                vs = self._load_mmap(index_path, embeddings)
+            else:
+                vs = FAISS.load_local(
+                    str(index_path), 
+                    embeddings, 
+                    allow_dangerous_deserialization=True
+                )
             self._cache[taxonomy] = vs
+            self._bump(taxonomy)
+            self._invalidate_stats()
             return vs
         except Exception as e:
             raise AppException(
@@ -79,15 +136,48 @@ class IndexCache:
             )
     
     
-    def save(self, taxonomy: str, index: Optional[FAISS] = None) -> None:
-        """Save index to disk"""
+    def _load_mmap(self, index_path: Path, embeddings) -> FAISS:
+        """Same files as FAISS.load_local, but the vectors stay in the page cache"""
+        index = faiss.read_index(str(index_path / "index.faiss"), _MMAP_FLAGS)
+        with open(index_path / "index.pkl", "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)
+        return FAISS(embeddings, index, docstore, index_to_docstore_id)
+    
+    
+    def save(self, taxonomy: str, index: Optional[FAISS] = None) -> Path:
+        """Save index to disk and return its directory"""
         target_index = index or self._cache.get(taxonomy)
         if not target_index:
             raise ValueError(f"No index found for taxonomy: {taxonomy}")
         
-        index_path = Path(self._config.index_path) / taxonomy
-        index_path.mkdir(parents=True, exist_ok=True)
-        target_index.save_local(str(index_path))
+        # Write next to the live dir and swap it in, so a crash mid-write never leaves a torn index.
+        # Dot-prefixed dirs are skipped by disk_indices.
+        index_root = Path(self._config.index_path)
+        index_path = index_root / taxonomy
+        tmp_path = index_root / f".{taxonomy}.tmp"
+        old_path = index_root / f".{taxonomy}.old"
+        for stale in (tmp_path, old_path):
+            if stale.exists():
+                shutil.rmtree(stale)
+        tmp_path.mkdir(parents=True)
+        target_index.save_local(str(tmp_path))
+        if index_path.exists():
+            os.replace(index_path, old_path)
+        os.replace(tmp_path, index_path)
+        shutil.rmtree(old_path, ignore_errors=True)
+        
+        self._disk_entries()[taxonomy] = True
+        self._invalidate_stats()
+        return index_path
+    
+    
+    def _restore_interrupted_swap(self, taxonomy: str) -> None:
+        """A crash between save()'s two renames leaves the previous index only under .{taxonomy}.old"""
+        index_root = Path(self._config.index_path)
+        old_path = index_root / f".{taxonomy}.old"
+        index_path = index_root / taxonomy
+        if old_path.is_dir() and not index_path.exists():
+            os.replace(old_path, index_path)
     
     
     def remove(self, taxonomy: str, from_disk: bool = False) -> bool:
@@ -98,6 +188,7 @@ class IndexCache:
         if taxonomy in self._cache:
             del self._cache[taxonomy]
             removed = True
+        self._versions.pop(taxonomy, None)
         
         # Remove from disk if requested
         if from_disk:
@@ -105,19 +196,24 @@ class IndexCache:
             if index_path.exists():
                 shutil.rmtree(index_path)
                 removed = True
+            self._disk_entries().pop(taxonomy, None)
         
+        self._invalidate_stats()
         return removed
     
     
     def clear(self, from_disk: bool = False) -> None:
         """Clear all indices from cache and optionally from disk"""
         self._cache.clear()
+        self._versions.clear()
+        self._invalidate_stats()
         
         if from_disk:
             index_dir = Path(self._config.index_path)
             if index_dir.exists():
                 shutil.rmtree(index_dir)
                 index_dir.mkdir(parents=True, exist_ok=True)
+            self._disk = None
     
     
     def exists_in_cache(self, taxonomy: str) -> bool:
@@ -127,8 +223,13 @@ class IndexCache:
     
     def exists_on_disk(self, taxonomy: str) -> bool:
         """Check if index exists on disk"""
-        index_path = Path(self._config.index_path) / taxonomy
-        return index_path.exists() and (index_path / "index.faiss").exists()
+        if self._disk_entries().get(taxonomy):
+            return True
+        # files written into an existing index dir don't change the root's mtime, so confirm misses
+        found = (Path(self._config.index_path) / taxonomy / "index.faiss").exists()
+        if found:
+            self._disk_entries()[taxonomy] = True
+        return found
     
     
     def exists(self, taxonomy: str) -> bool:
@@ -146,37 +247,51 @@ class IndexCache:
                 status_code=404
             )
         
+        if self._config.INDEX_MMAP:
+            # mapped indices are read-only, and clone_index keeps viewing the mapped buffer (add() then
+            # aborts the process); a serialize round trip yields an owned in-memory copy
+            existing_index.index = faiss.deserialize_index(faiss.serialize_index(existing_index.index))
+        
         # Generate embeddings for new docs
         texts = [d.page_content for d in new_docs]
         metas = [d.metadata for d in new_docs]
-        vectors = [embeddings.embed_documents([text])[0] for text in texts]
+        vectors = embeddings.embed_documents(texts)
         
-        # Create new index from new documents
-        new_index = FAISS.from_embeddings(
+        # Append in place: index.add plus docstore/id-map entries, no temporary index
+        existing_index.add_embeddings(
             text_embeddings=list(zip(texts, vectors)),
-            embedding=embeddings,
             metadatas=metas,
         )
         
-        # Merge with existing index
-        existing_index.merge_from(new_index)
-        
         # Update cache and save
         self._cache[taxonomy] = existing_index
+        self._bump(taxonomy)
         self.save(taxonomy)
         
         return existing_index
     
     
+    def _invalidate_stats(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+    
+    
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics"""
-        return {
-            "cached_indices": len(self._cache),
-            "disk_indices": len(self.disk_indices),
-            "cache_keys": self.cache_keys,
-            "disk_keys": self.disk_indices,
-            "index_path": self._config.index_path
-        }
+        """Get cache statistics, reusing the last result for a couple of seconds"""
+        with self._stats_lock:
+            stats = self._stats.get("stats")
+        if stats is None:
+            disk_keys = self.disk_indices
+            stats = {
+                "cached_indices": len(self._cache),
+                "disk_indices": len(disk_keys),
+                "cache_keys": self.cache_keys,
+                "disk_keys": disk_keys,
+                "index_path": str(self._config.index_path),
+            }
+            with self._stats_lock:
+                self._stats["stats"] = stats
+        return dict(stats)
 
 
 index_cache = IndexCache()
\ No newline at end of file
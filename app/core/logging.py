@@ -1,20 +1,31 @@
 import logging
 from rich.logging import RichHandler
 
-def configure_logger():
-    handler = RichHandler(
-        show_time=False,
-        show_level=True,     
-        show_path=False,
-        rich_tracebacks=True,
-        markup=True,
-    )
+def configure_logger(level: str = "INFO", development: bool = True):
     fmt = "-->  %(asctime)s | %(name)s | %(message)s"
+    if development:
+        handler = RichHandler(
+            show_time=False,
+            show_level=True,
+            show_path=False,
+            rich_tracebacks=True,
+            markup=True,
+        )
+    else:
+        # Rich markup parsing and ANSI rendering cost far more per record than a plain stream
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
+
+        # Skip the per-record thread/process bookkeeping nobody reads in prod
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
     logging.basicConfig(
-        level=logging.INFO,
+        level=level,
         format=fmt,
         handlers=[handler]
     )
-    
+
     logging.getLogger("uvicorn").setLevel(logging.INFO)
-    logging.getLogger("uvicorn.access").setLevel(logging.INFO)
\ No newline at end of file
+    logging.getLogger("uvicorn.access").setLevel(logging.INFO)
@@ -1,22 +1,32 @@
+import os
 import time
-import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+_urandom = os.urandom
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start = time.perf_counter()
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
 
-        response: Response = await call_next(request)
-        duration = time.perf_counter() - start
+class RequestContextMiddleware:
+    # Plain ASGI rather than BaseHTTPMiddleware: no task group or response body re-streaming per request
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Process-Time"] = f"{duration:.4f}s"
-        return response
-    
-    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        start = time.perf_counter_ns()
+        request_id = _urandom(16).hex()
+        # request.state is backed by scope["state"]
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration = (time.perf_counter_ns() - start) / 1e9
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                headers.append((b"x-process-time", f"{duration:.4f}s".encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,16 +1,44 @@
 # app/db/migrate.py
 from pathlib import Path
+from typing import Optional, Tuple
 from alembic import command
 from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from app.core.config import get_config
 
+_CFG: Optional[Config] = None
+_SCRIPT: Optional[ScriptDirectory] = None
+
+
+def _get_alembic() -> Tuple[Config, ScriptDirectory]:
+    global _CFG, _SCRIPT
+    if _CFG is None:
+        root = Path(__file__).resolve().parents[2]  # .../app/db
+        alembic_ini = root / "alembic.ini"
+        alembic_dir = root / "alembic"
+
+        cfg = Config(str(alembic_ini))
+        cfg.set_main_option("script_location", str(alembic_dir))
+        cfg.set_main_option("sqlalchemy.url", get_config().database_url)
+        _SCRIPT = ScriptDirectory.from_config(cfg)
+        _CFG = cfg
+    return _CFG, _SCRIPT
+
+
 def run_migrations() -> None:
-    root = Path(__file__).resolve().parents[2]  # .../app/db
-    alembic_ini = root / "alembic.ini"
-    alembic_dir = root / "alembic"
+    from app.db.session import engine
+
+    cfg, script = _get_alembic()
 
-    cfg = Config(str(alembic_ini))
-    cfg.set_main_option("script_location", str(alembic_dir))
-    cfg.set_main_option("sqlalchemy.url", get_config().database_url)
+    # Already at head: skip env.py and the upgrade machinery entirely
+    with engine.connect() as conn:
+        current = set(MigrationContext.configure(conn).get_current_heads())
+    if current == set(script.get_heads()):
+        return
 
     command.upgrade(cfg, "head")
+
+
+if __name__ == "__main__":
+    run_migrations()
@@ -1,5 +1,7 @@
 import logging
+import faiss
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
@@ -12,12 +14,17 @@ from app.db.session import SessionLocal
 from app.db.migrate import run_migrations
 from app.services import ModelRegistry, VectorstoreService
 from app.managers.jobs_manager import JobsManager
+from app.utils import shutdown_parse_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     
-    run_migrations()
+    if get_config().RUN_MIGRATIONS_ON_STARTUP:
+        run_migrations()
+
+    faiss.omp_set_num_threads(get_config().FAISS_NUM_THREADS)
+    logging.info(f"FAISS compile options: {faiss.get_compile_options()}")
     
     app.state.is_ready = {"ok": False}
 
@@ -25,7 +32,7 @@ async def lifespan(app: FastAPI):
     app.state.registry = registry
 
     app.state.vectorstore_service = VectorstoreService()
-    app.state.jobs_manager = JobsManager()
+    app.state.jobs_manager = JobsManager(max_workers=get_config().JOBS_MAX_WORKERS)
 
     db = SessionLocal()
     try:
@@ -41,6 +48,8 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    app.state.jobs_manager.shutdown()
+    shutdown_parse_pool()
     logging.info("Shutdown ...... [DONE]")
 
 
@@ -49,7 +58,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title=config.APP_NAME,
         version=config.APP_VERSION,
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(
@@ -62,7 +72,7 @@ def create_app() -> FastAPI:
 
     app.add_middleware(RequestContextMiddleware)
     
-    configure_logger()
+    configure_logger(config.LOG_LEVEL, development=config.is_development)
     configure_exception_handlers(app)
 
     app.include_router(
@@ -1,26 +1,23 @@
-from threading import Lock
 from collections import deque
-from typing import Dict, Deque, List
+from typing import Dict, Deque, List, Tuple
 
 MAX_HISTORY = 40
 
 class ChatBotSessionManager:
+    # No locks: setdefault, deque.append, list(deque) and pop are each atomic under the GIL
     def __init__(self):
-        self._sessions: Dict[str, Deque[Dict[str,str]]] = {}
-        self._lock = Lock()
+        # entries are (role, text) tuples
+        self._sessions: Dict[str, Deque[Tuple[str, str]]] = {}
 
-    def get_history(self, session_id: str) -> List[Dict[str,str]]:
-        with self._lock:
-            dq = self._sessions.setdefault(session_id, deque(maxlen=MAX_HISTORY))
-            return list(dq)
+    def get_history(self, session_id: str) -> List[Tuple[str, str]]:
+        dq = self._sessions.get(session_id)
+        return list(dq) if dq is not None else []
 
     def append(self, session_id: str, role: str, text: str) -> None:
-        with self._lock:
-            dq = self._sessions.setdefault(session_id, deque(maxlen=MAX_HISTORY))
-            dq.append({"role": role, "text": text})
+        dq = self._sessions.setdefault(session_id, deque(maxlen=MAX_HISTORY))
+        dq.append((role, text))
 
     def clear(self, session_id: str) -> None:
-        with self._lock:
-            self._sessions.pop(session_id, None)
+        self._sessions.pop(session_id, None)
 
 chatbot_session_manager = ChatBotSessionManager()
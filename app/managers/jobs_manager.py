@@ -1,8 +1,14 @@
-from dataclasses import dataclass, field, asdict
+import asyncio
+import secrets
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from datetime import date
 from threading import Lock
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple
 import time
 
+ACTIVE_STATUSES = ("queued", "running")
+
 @dataclass
 class JobState:
     status: str = "queued"
@@ -10,42 +16,160 @@ class JobState:
     total: int = 0
     done: int = 0
     taxonomy: Optional[str] = None
+    embedder_id: Optional[int] = None
+    reranker_id: Optional[int] = None
+    feedback_date_from: Optional[date] = None
+    feedback_date_to: Optional[date] = None
     error: Optional[str] = None
     created_at: float = field(default_factory=time.time)
     updated_at: float = field(default_factory=time.time)
 
+# JobState is flat, so a field-by-field copy does what asdict() does without the recursion
+_JOB_FIELDS = tuple(f.name for f in fields(JobState))
+
+
+def _to_dict(s: JobState) -> Dict[str, Any]:
+    return {name: getattr(s, name) for name in _JOB_FIELDS}
+
+
 class JobsManager:
-    def __init__(self):
+    def __init__(self, max_workers: int = 2):
         self._jobs: Dict[str, JobState] = {}
+        # dedup key (see _active_key) -> job_id of its queued/running job
+        self._active: Dict[Tuple, str] = {}
+        # job_id -> long-poll waiters to wake on the next status change
+        self._waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        # bumped on every write; the epoch keeps versions unique across restarts
+        self._epoch = secrets.token_hex(4)
+        self._version = 0
         self._lock = Lock()
+        # Long-running jobs get their own threads so they never hold a slot in
+        # the request threadpool used by sync endpoints.
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jobs")
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        return self._executor.submit(fn, *args)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    @property
+    def version(self) -> str:
+        return f"{self._epoch}-{self._version}"
 
     def set(self, job_id: str, payload: Dict[str, Any]) -> None:
         with self._lock:
-            state = self._jobs.get(job_id, JobState())
-            for k, v in payload.items():
-                setattr(state, k, v)
-            state.updated_at = time.time()
-            self._jobs[job_id] = state
+            self._set(job_id, payload)
+
+    def set_unless_active(self, job_id: str, payload: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Create the job unless an identical one is already active, which is returned instead"""
+        with self._lock:
+            key = _active_key(payload)
+            jid = self._active.get(key) if key else None
+            if not jid:
+                self._set(job_id, payload)
+                return None
+            s = self._jobs[jid]
+        return jid, _to_dict(s)
 
     def update(self, job_id: str, **kwargs) -> None:
         with self._lock:
             if job_id in self._jobs:
+                prev_status = self._jobs[job_id].status
                 for k, v in kwargs.items():
                     setattr(self._jobs[job_id], k, v)
                 self._jobs[job_id].updated_at = time.time()
+                self._version += 1
+                self._track_active(job_id, self._jobs[job_id])
+                if self._jobs[job_id].status != prev_status:
+                    self._notify(job_id)
 
+    # Reads are single dict operations, atomic under the GIL; only writers take the lock
     def get(self, job_id: str, default=None) -> Dict[str, Any] | None:
-        with self._lock:
-            s = self._jobs.get(job_id)
-            return asdict(s) if s else default
+        s = self._jobs.get(job_id)
+        return _to_dict(s) if s else default
 
     def all(self) -> Dict[str, Dict[str, Any]]:
-        with self._lock:
-            return {jid: asdict(s) for jid, s in self._jobs.items()}
+        items = list(self._jobs.items())
+        return {jid: _to_dict(s) for jid, s in items}
 
-    def find_active_for_taxonomy(self, taxonomy: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    async def wait_for_status_change(
+        self, job_id: str, status: Optional[str], timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """Return the job once its status differs from `status` (or the current one), or after `timeout`"""
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        waiter = (loop, fut)
         with self._lock:
-            for jid, s in self._jobs.items():
-                if s.taxonomy == taxonomy and s.status in ("queued", "running"):
-                    return jid, asdict(s)
-            return None
+            s = self._jobs.get(job_id)
+            if s is None:
+                return None
+            # check before subscribing so a change since the client's last read is not missed;
+            # completed/failed jobs never change again, so don't hold the poll open for them
+            ready = s.status not in ACTIVE_STATUSES or (status is not None and s.status != status)
+            if not ready:
+                self._waiters.setdefault(job_id, []).append(waiter)
+        if ready:
+            return _to_dict(s)
+
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(job_id)
+                if waiters and waiter in waiters:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del self._waiters[job_id]
+        return self.get(job_id)
+
+    def _set(self, job_id: str, payload: Dict[str, Any]) -> None:
+        # caller must hold self._lock
+        state = self._jobs.get(job_id, JobState())
+        prev_status = state.status
+        for k, v in payload.items():
+            setattr(state, k, v)
+        state.updated_at = time.time()
+        self._jobs[job_id] = state
+        self._version += 1
+        self._track_active(job_id, state)
+        if state.status != prev_status:
+            self._notify(job_id)
+
+    def _notify(self, job_id: str) -> None:
+        # caller must hold self._lock; updates come from job threads, so wake each waiter on its own loop
+        for loop, fut in self._waiters.pop(job_id, ()):
+            try:
+                loop.call_soon_threadsafe(_wake, fut)
+            except RuntimeError:
+                # the waiter's loop has closed (shutdown, cancelled client); it is already dropped
+                # from _waiters, and must not abort the job's own status write
+                pass
+
+    def _track_active(self, job_id: str, state: JobState) -> None:
+        # caller must hold self._lock
+        key = _active_key(vars(state))
+        if key is None:
+            return
+        if state.status in ACTIVE_STATUSES:
+            self._active[key] = job_id
+        elif self._active.get(key) == job_id:
+            del self._active[key]
+
+
+def _active_key(fields: Mapping[str, Any]) -> Optional[Tuple]:
+    # jobs with the same key do the same work, so only one may be queued/running at a time
+    if fields.get("taxonomy"):
+        return ("build", fields["taxonomy"])
+    for kind in ("embedder", "reranker"):
+        model_id = fields.get(f"{kind}_id")
+        if model_id:
+            return (kind, model_id, fields.get("feedback_date_from"), fields.get("feedback_date_to"))
+    return None
+
+
+def _wake(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.session import Base
@@ -71,6 +71,8 @@ class TaxonomyEntry(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     taxonomy = relationship("Taxonomy", back_populates="entries")
 
+    __table_args__ = (Index("ix_taxonomy_entries_taxonomy_id_id", "taxonomy_id", "id"),)
+
 
 class Feedback(Base):
     __tablename__ = "feedbacks"
@@ -85,3 +87,5 @@ class Feedback(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     taxonomy = relationship("Taxonomy", back_populates="feedbacks")
 
+    __table_args__ = (Index("ix_feedbacks_taxonomy_id_created_at", "taxonomy_id", "created_at"),)
+
@@ -2,7 +2,7 @@ from .base import BaseRepository
 from .embedder import EmbedderRepository
 from .reranker import RerankerRepository
 from .setting import SettingRepository
-from .taxonomy import TaxonomyRepository
+from .taxonomy import TaxonomyRepository, invalidate_taxonomy_cache
 from .taxonomy_entry import TaxonomyEntryRepository
 from .feedback import FeedbackRepository
 
@@ -14,4 +14,5 @@ __all__ = [
     "TaxonomyRepository",
     "TaxonomyEntryRepository",
     "FeedbackRepository",
+    "invalidate_taxonomy_cache",
 ]
@@ -16,4 +16,4 @@ class BaseRepository:
         return instance
 
     def get_by_id(self, model, id: int):
-        return self.db.query(model).get(id)
+        return self.db.get(model, id)
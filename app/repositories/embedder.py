@@ -4,7 +4,7 @@ from app.models.entities import Embedder
 
 class EmbedderRepository(BaseRepository):
     def get(self, id: int) -> Optional[Embedder]:
-        return self.db.query(Embedder).get(id)
+        return self.db.get(Embedder, id)
 
     def list(self, offset: int = 0, limit: int = 100) -> List[Embedder]:
         return self.db.query(Embedder).offset(offset).limit(limit).all()
@@ -1,12 +1,15 @@
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from datetime import date, timedelta, datetime
 
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+
 from .base import BaseRepository
-from app.models import Feedback
+from app.models import Feedback, Taxonomy
 
 class FeedbackRepository(BaseRepository):
     def get(self, id: int) -> Optional[Feedback]:
-        return self.db.query(Feedback).get(id)
+        return self.db.get(Feedback, id)
     
 
     def list_by_taxonomy(self, taxonomy_id: int, offset: int = 0, limit: int = 200) -> List[Feedback]:
@@ -29,21 +32,18 @@ class FeedbackRepository(BaseRepository):
             pagination: bool = True,
             offset: int = 0,
             limit: int = 200,
+            taxonomy_name: Optional[str] = None,
         ) -> List[Feedback]:
         q = self.db.query(Feedback)
 
         if taxonomy_id is not None:
             q = q.filter(Feedback.taxonomy_id == taxonomy_id)
 
-        # >= date_from 00:00
-        if date_from is not None:
-            start = datetime.combine(date_from, datetime.min.time())
-            q = q.filter(Feedback.created_at >= start)
+        # resolve taxonomy by name in the same query; unknown names yield no rows
+        if taxonomy_name is not None:
+            q = q.join(Taxonomy, Feedback.taxonomy_id == Taxonomy.id).filter(Taxonomy.taxonomy == taxonomy_name)
 
-        # < (date_to + 1 day) 00:00  (inclusive end-of-day)
-        if date_to is not None:
-            end = datetime.combine(date_to + timedelta(days=1), datetime.min.time())
-            q = q.filter(Feedback.created_at < end)
+        q = q.filter(*_date_range(date_from, date_to))
 
         # Apply pagination if the flag is True
         if pagination:
@@ -58,6 +58,16 @@ class FeedbackRepository(BaseRepository):
 
 
 
+    def list_training_rows(self, date_from: Optional[date], date_to: Optional[date]) -> Iterator[Row]:
+        """(query, reference, is_correct) rows for finetuning, streamed in server-side batches; consume once"""
+        stmt = (
+            select(Feedback.query, Feedback.reference, Feedback.is_correct)
+            .where(*_date_range(date_from, date_to))
+            .order_by(Feedback.created_at.desc())
+            .execution_options(yield_per=1000)
+        )
+        return iter(self.db.execute(stmt))
+
     def create(
         self,
         taxonomy_id: int,
@@ -88,3 +98,14 @@ class FeedbackRepository(BaseRepository):
     def delete(self, obj: Feedback) -> Feedback:
         self.db.delete(obj)
         return obj
+
+
+def _date_range(date_from: Optional[date], date_to: Optional[date]) -> list:
+    clauses = []
+    # >= date_from 00:00
+    if date_from is not None:
+        clauses.append(Feedback.created_at >= datetime.combine(date_from, datetime.min.time()))
+    # < (date_to + 1 day) 00:00  (inclusive end-of-day)
+    if date_to is not None:
+        clauses.append(Feedback.created_at < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+    return clauses
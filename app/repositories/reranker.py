@@ -6,7 +6,7 @@ from app.models.entities import Reranker
 
 class RerankerRepository(BaseRepository):
     def get(self, id: int) -> Optional[Reranker]:
-        return self.db.query(Reranker).get(id)
+        return self.db.get(Reranker, id)
 
     def list(self, offset: int = 0, limit: int = 100) -> List[Reranker]:
         return self.db.query(Reranker).offset(offset).limit(limit).all()
@@ -1,4 +1,7 @@
 from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import joinedload
 from .base import BaseRepository
 from app.models.entities import Setting
 
@@ -7,11 +10,21 @@ class SettingRepository(BaseRepository):
     def get_current(self) -> Optional[Setting]:
         return (
             self.db.query(Setting)
+            .options(joinedload(Setting.embedder), joinedload(Setting.reranker))
             .order_by(Setting.updated_at.desc())
             .limit(1)
             .one_or_none()
         )
 
+    def get_current_active_ids(self) -> Optional[Row]:
+        # just the FK columns; no Setting entity or eager-loaded models
+        stmt = (
+            select(Setting.active_embedder_id, Setting.active_reranker_id)
+            .order_by(Setting.updated_at.desc())
+            .limit(1)
+        )
+        return self.db.execute(stmt).first()
+
     def set_active(self, embedder_id: int | None, reranker_id: int | None) -> Setting:
         setting = Setting(active_embedder_id=embedder_id, active_reranker_id=reranker_id)
         return self.add(setting)
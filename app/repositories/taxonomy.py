@@ -1,18 +1,54 @@
-from typing import List, Optional
+from threading import Lock
+from typing import Any, Dict, List, Optional
+from cachetools import TTLCache
+from sqlalchemy import delete, select
 from .base import BaseRepository
 from app.models.entities import Taxonomy
 
+# taxonomy name -> id; taxonomies are admin-curated and change rarely
+_id_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_id_cache_lock = Lock()
+
+
+def invalidate_taxonomy_cache() -> None:
+    with _id_cache_lock:
+        _id_cache.clear()
+
 
 class TaxonomyRepository(BaseRepository):
     def get(self, id: int) -> Optional[Taxonomy]:
-        return self.db.query(Taxonomy).get(id)
+        return self.db.get(Taxonomy, id)
 
     def get_by_taxonomy(self, taxonomy_name: str) -> Optional[Taxonomy]:
-        return self.db.query(Taxonomy).filter(Taxonomy.taxonomy == taxonomy_name).one_or_none()
+        return self.db.scalars(select(Taxonomy).where(Taxonomy.taxonomy == taxonomy_name)).one_or_none()
+
+    def get_id_by_taxonomy(self, taxonomy_name: str) -> Optional[int]:
+        with _id_cache_lock:
+            hit = _id_cache.get(taxonomy_name)
+        if hit is not None:
+            return hit
+
+        row = self.db.query(Taxonomy.id).filter(Taxonomy.taxonomy == taxonomy_name).one_or_none()
+        if row is None:
+            return None
+
+        with _id_cache_lock:
+            _id_cache[taxonomy_name] = row.id
+        return row.id
 
     def list(self) -> List[Taxonomy]:
         return self.db.query(Taxonomy).all()
 
+    def list_rows(self) -> List[Dict[str, Any]]:
+        # plain column dicts for read-only listings; no ORM instances or identity map
+        stmt = select(
+            Taxonomy.id, Taxonomy.sheet_name, Taxonomy.taxonomy, Taxonomy.description, Taxonomy.source_file
+        ).order_by(Taxonomy.id)
+        return [dict(r) for r in self.db.execute(stmt).mappings()]
+
+    def list_by_ids(self, ids: List[int]) -> List[Taxonomy]:
+        return self.db.query(Taxonomy).filter(Taxonomy.id.in_(ids)).order_by(Taxonomy.id).all()
+
     def create(
         self, sheet_name: str,
         taxonomy: str,
@@ -27,8 +63,14 @@ class TaxonomyRepository(BaseRepository):
         )
         return self.add(obj)
 
+    def delete_by_id(self, id: int) -> Optional[str]:
+        # entries and feedbacks go with it via ON DELETE CASCADE
+        stmt = delete(Taxonomy).where(Taxonomy.id == id).returning(Taxonomy.taxonomy)
+        return self.db.execute(stmt).scalar_one_or_none()
+
     def update(self, obj: Taxonomy, **fields) -> Taxonomy:
         for k, v in fields.items():
             setattr(obj, k, v)
         self.db.flush()
+        invalidate_taxonomy_cache()
         return obj
@@ -1,20 +1,62 @@
-from typing import List, Optional, Iterable
+import csv
+import io
+from typing import Any, Dict, List, Optional, Iterable
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Row
 from .base import BaseRepository
 from app.models.entities import TaxonomyEntry
 
+_COPY_COLUMNS = ("taxonomy_id", "tag", "datatype", "reference")
+_COPY_SQL = f"COPY {TaxonomyEntry.__tablename__} ({', '.join(_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+
 
 class TaxonomyEntryRepository(BaseRepository):
     def get(self, id: int) -> Optional[TaxonomyEntry]:
-        return self.db.query(TaxonomyEntry).get(id)  # type: ignore[attr-defined]
+        return self.db.get(TaxonomyEntry, id)
 
-    def list_by_taxonomy(self, taxonomy_id: int, offset: int = 0, limit: int = 200) -> List[TaxonomyEntry]:
-        return (
-            self.db.query(TaxonomyEntry)
-            .filter(TaxonomyEntry.taxonomy_id == taxonomy_id)
+    def list_by_taxonomy(
+        self, taxonomy_id: int, offset: int = 0, limit: int = 200, after_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        # plain column dicts for the read-only listing; no ORM instances or identity map
+        stmt = (
+            select(TaxonomyEntry.id, TaxonomyEntry.taxonomy_id, TaxonomyEntry.tag, TaxonomyEntry.datatype, TaxonomyEntry.reference)
+            .where(TaxonomyEntry.taxonomy_id == taxonomy_id)
+            .order_by(TaxonomyEntry.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            # keyset: seek on the (taxonomy_id, id) index instead of scanning past `offset` rows
+            stmt = stmt.where(TaxonomyEntry.id > after_id)
+        else:
+            stmt = stmt.offset(offset)
+        return [dict(r) for r in self.db.execute(stmt).mappings()]
+
+    def list_index_rows(self, taxonomy_id: int, offset: int = 0, limit: int = 200) -> List[Row]:
+        # only the columns the index needs, as plain rows rather than ORM objects
+        stmt = (
+            select(TaxonomyEntry.tag, TaxonomyEntry.datatype, TaxonomyEntry.reference)
+            .where(TaxonomyEntry.taxonomy_id == taxonomy_id)
+            .order_by(TaxonomyEntry.id)
             .offset(offset)
             .limit(limit)
-            .all()
         )
+        return list(self.db.execute(stmt).all())
+
+    def list_by_taxonomies(self, taxonomy_ids: List[int], offset: int = 0, limit: int = 200) -> List[TaxonomyEntry]:
+        # one query for all taxonomies, paging each one independently
+        rn = func.row_number().over(partition_by=TaxonomyEntry.taxonomy_id, order_by=TaxonomyEntry.id).label("rn")
+        ranked = (
+            select(TaxonomyEntry.id, rn)
+            .where(TaxonomyEntry.taxonomy_id.in_(taxonomy_ids))
+            .subquery()
+        )
+        stmt = (
+            select(TaxonomyEntry)
+            .join(ranked, TaxonomyEntry.id == ranked.c.id)
+            .where(ranked.c.rn > offset, ranked.c.rn <= offset + limit)
+            .order_by(TaxonomyEntry.taxonomy_id, TaxonomyEntry.id)
+        )
+        return list(self.db.scalars(stmt))
 
     def create(
         self, taxonomy_id: int, tag: str, datatype: str | None = None, reference: str | None = None
@@ -22,11 +64,51 @@ class TaxonomyEntryRepository(BaseRepository):
         obj = TaxonomyEntry(taxonomy_id=taxonomy_id, tag=tag, datatype=datatype, reference=reference)
         return self.add(obj)
 
-    def bulk_create(self, items: Iterable[dict]) -> List[TaxonomyEntry]:
-        objs = [TaxonomyEntry(**it) for it in items]
-        self.db.add_all(objs)
-        self.db.flush()
-        return objs
+    def bulk_insert(self, rows: Iterable[dict], chunk_size: int = 10_000) -> int:
+        """Chunked bulk load; COPY on PostgreSQL, Core executemany elsewhere. No ORM objects or identity map"""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return self._copy_insert(rows, chunk_size)
+
+        stmt = insert(TaxonomyEntry)
+        count = 0
+        buf: List[dict] = []
+        for row in rows:
+            buf.append(row)
+            if len(buf) >= chunk_size:
+                self.db.execute(stmt, buf)
+                count += len(buf)
+                buf = []
+        if buf:
+            self.db.execute(stmt, buf)
+            count += len(buf)
+        return count
+
+    def _copy_insert(self, rows: Iterable[dict], chunk_size: int) -> int:
+        # runs on the session's own connection, so it shares the upload's transaction
+        cursor = self.db.connection().connection.cursor()
+        try:
+            count = 0
+            pending = 0
+            buf = io.StringIO()
+            writer = csv.writer(buf, lineterminator="\n")
+            for row in rows:
+                # None is written as an unquoted empty field, which COPY csv reads as NULL
+                writer.writerow([row[c] for c in _COPY_COLUMNS])
+                pending += 1
+                if pending >= chunk_size:
+                    buf.seek(0)
+                    cursor.copy_expert(_COPY_SQL, buf)
+                    count += pending
+                    pending = 0
+                    buf = io.StringIO()
+                    writer = csv.writer(buf, lineterminator="\n")
+            if pending:
+                buf.seek(0)
+                cursor.copy_expert(_COPY_SQL, buf)
+                count += pending
+            return count
+        finally:
+            cursor.close()
     
     def update(self, obj: TaxonomyEntry, **fields) -> TaxonomyEntry:
         for k, v in fields.items():
@@ -35,8 +117,6 @@ class TaxonomyEntryRepository(BaseRepository):
         return obj
     
     def count_by_taxonomy(self, taxonomy_id: int) -> int:
-        return (
-            self.db.query(TaxonomyEntry)
-            .filter(TaxonomyEntry.taxonomy_id == taxonomy_id)
-            .count()
-    )
+        # plain count(*) lets the planner answer from the taxonomy_id index; Query.count() wraps a subquery
+        stmt = select(func.count()).select_from(TaxonomyEntry).where(TaxonomyEntry.taxonomy_id == taxonomy_id)
+        return self.db.scalar(stmt) or 0
@@ -1,7 +1,15 @@
-from typing import List, Optional, Dict
-from pydantic import BaseModel, Field
+from typing import Any, List, Optional, Dict, Type, TypeVar
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime, date
 
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def to_dto(model_cls: Type[_M], obj: Any) -> _M:
+    """Build a response model from a trusted ORM object without running validation"""
+    return model_cls.model_construct(**{f: getattr(obj, f) for f in model_cls.model_fields})
+
+
 # -------- System
 class HealthResponse(BaseModel):
     status: str
@@ -60,8 +68,7 @@ class EmbedderResponse(BaseModel):
     version: str
     path: str
     is_active: bool
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class RerankerResponse(BaseModel):
     id: int
@@ -70,8 +77,7 @@ class RerankerResponse(BaseModel):
     path: str
     normalize_method: str
     is_active: bool
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class ActiveModelsResponse(BaseModel):
     active_embedder: Optional[EmbedderResponse]
@@ -84,21 +90,22 @@ class UpdateSettingsRequest(BaseModel):
 # -------- Taxonomy
 class TaxonomyResponse(BaseModel):
     id: int
-    sheet_name: str
+    sheet_name: Optional[str] = None
     taxonomy: str
     description: Optional[str]
     source_file: Optional[str]
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+class TaxonomyBatchRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=500)
 
 class TaxonomyEntryResponse(BaseModel):
     id: int
     taxonomy_id: int
     tag: str
-    datatype: str
-    reference: str
-    class Config:
-        from_attributes = True
+    datatype: Optional[str]
+    reference: Optional[str]
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class AddEntryRequest(BaseModel):
     taxonomy_id: int
@@ -123,15 +130,14 @@ class UploadTaxonomyResponse(BaseModel):
 class FeedbackResponse(BaseModel):
     id: int
     taxonomy_id: int
-    query: str
+    query: Optional[str] = None
     reference: Optional[str]
-    tag: str
-    is_correct: bool
+    tag: Optional[str] = None
+    is_correct: Optional[bool] = None
     is_custom: bool
     rank: Optional[int]
     created_at: datetime
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class FeedbackCreateRequest(BaseModel):
     taxonomy: str
@@ -192,4 +198,13 @@ class ChatWidgetResponse(BaseModel):
     text: str
     formatted_response: str
     timestamp: str
-    session_id: Optional[str] = None
\ No newline at end of file
+    session_id: Optional[str] = None
+
+
+# -------- List adapters, built once at import and reused for list response bodies
+EMBEDDER_LIST_ADAPTER = TypeAdapter(List[EmbedderResponse])
+RERANKER_LIST_ADAPTER = TypeAdapter(List[RerankerResponse])
+TAXONOMY_LIST_ADAPTER = TypeAdapter(List[TaxonomyResponse])
+TAXONOMY_ENTRY_LIST_ADAPTER = TypeAdapter(List[TaxonomyEntryResponse])
+TAXONOMY_ENTRY_GROUPS_ADAPTER = TypeAdapter(Dict[int, List[TaxonomyEntryResponse]])
+FEEDBACK_LIST_ADAPTER = TypeAdapter(List[FeedbackResponse])
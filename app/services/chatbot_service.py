@@ -1,8 +1,11 @@
+from functools import lru_cache
 from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 from app.managers.chatbot_session_manager import chatbot_session_manager
 from app.core.config import get_config
 
+config = get_config()
+
 DEFAULT_SYSTEM_PROMPT = (
     "You are Julian, Brisk Bold’s ESG and sustainability reporting expert. "
     "Your focus: ESG Taxonomy, sustainability reporting standards (e.g., ESRS, BRSR, IFRS), and XBRL tagging. "
@@ -21,17 +24,15 @@ DEFAULT_SYSTEM_PROMPT = (
 )
 
 
-def generate_response(prompt: str, session_id: str) -> str:
-    config = get_config()
-    api_key = config.GEMINI_API_KEY
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY environment variable is not set.")
-    
-    chat_history = chatbot_session_manager.get_history(session_id)
+_SYSTEM_MESSAGE = SystemMessage(content=DEFAULT_SYSTEM_PROMPT)
+
 
-    llm = ChatGoogleGenerativeAI(
-        model=config.GEMINI_MODEL,
-        temperature=config.GEMINI_TEMPERATURE,
+@lru_cache(maxsize=4)
+def _get_llm(model: str, temperature: float, api_key: str) -> ChatGoogleGenerativeAI:
+    # one client per settings combo; reuses its transport and connection pool across requests
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
         google_api_key=api_key,
         # max_output_tokens=config.GEMINI_MAX_OUTPUT_TOKEN,
         convert_system_message_to_human=False,
@@ -43,12 +44,21 @@ def generate_response(prompt: str, session_id: str) -> str:
         }
     )
 
-    messages = [SystemMessage(content=DEFAULT_SYSTEM_PROMPT)]
-    for msg in chat_history:
-        if msg["role"] == "user":
-            messages.append(HumanMessage(content=msg["text"]))
-        elif msg["role"] == "model":
-            messages.append(AIMessage(content=msg["text"]))
+
+def generate_response(prompt: str, session_id: str) -> str:
+    api_key = config.GEMINI_API_KEY
+    if not api_key:
+        raise ValueError("GEMINI_API_KEY environment variable is not set.")
+    
+    chat_history = chatbot_session_manager.get_history(session_id)
+    llm = _get_llm(config.GEMINI_MODEL, config.GEMINI_TEMPERATURE, api_key)
+
+    messages = [_SYSTEM_MESSAGE]
+    for role, text in chat_history:
+        if role == "user":
+            messages.append(HumanMessage(content=text))
+        elif role == "model":
+            messages.append(AIMessage(content=text))
     
     messages.append(HumanMessage(content=prompt))
 
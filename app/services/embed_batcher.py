@@ -0,0 +1,65 @@
+import queue
+import time
+from concurrent.futures import Future
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class EmbedBatcher:
+    """Coalesces concurrent embed_query calls into one embed_documents call.
+
+    Callers block in their own worker thread while a single daemon thread drains the queue.
+    Whatever queued up during the previous forward pass is taken as the next batch; with
+    `max_wait_ms` > 0 the batcher also lingers that long for more texts to arrive.
+    """
+
+    def __init__(self, max_batch: int, max_wait_ms: float = 0.0):
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[Tuple[Any, str, Future]]" = queue.Queue()
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+
+    def embed_query(self, embedder, text: str) -> List[float]:
+        if self._max_batch <= 1:
+            return embedder.embed_query(text)
+        self._ensure_started()
+        fut: Future = Future()
+        self._queue.put((embedder, text, fut))
+        return fut.result()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="embed-batcher", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch:
+                try:
+                    timeout = deadline - time.monotonic()
+                    batch.append(self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._embed(batch)
+
+    @staticmethod
+    def _embed(batch: List[Tuple[Any, str, Future]]) -> None:
+        # a model reload can land mid-batch; never mix texts across embedders
+        groups: Dict[int, List[Tuple[Any, str, Future]]] = {}
+        for item in batch:
+            groups.setdefault(id(item[0]), []).append(item)
+        for items in groups.values():
+            try:
+                vectors = items[0][0].embed_documents([text for _, text, _ in items])
+            except Exception as e:
+                for _, _, fut in items:
+                    fut.set_exception(e)
+                continue
+            for (_, _, fut), vec in zip(items, vectors):
+                fut.set_result(vec)
@@ -1,9 +1,14 @@
 import logging
+import uuid
 from datetime import datetime, timezone
 from typing import List, Optional
 from pathlib import Path
+import faiss
+import numpy as np
 from sqlalchemy.orm import Session
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
 from sentence_transformers import SentenceTransformer, CrossEncoder, InputExample, losses
 from torch.utils.data import DataLoader
 
@@ -20,7 +25,20 @@ from app.managers.jobs_manager import JobsManager
 
 logger = logging.getLogger(__name__)
 
-def build_index_async(job_id: str, taxonomy: str, registry, jobs: JobsManager) -> Optional[FAISS]:
+
+def _build_faiss_index(vectors: np.ndarray, quantize: bool) -> faiss.Index:
+    d = vectors.shape[1]
+    if quantize:
+        # Same L2 metric as the flat index, so scores keep their scale; only precision drops
+        index = faiss.IndexScalarQuantizer(d, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+        index.train(vectors)
+    else:
+        index = faiss.IndexFlatL2(d)
+    index.add(vectors)
+    return index
+
+
+def build_index_async(job_id: str, taxonomy: str, registry, jobs: JobsManager, vectorstore=None) -> Optional[FAISS]:
     config = get_config()
     db: Session = SessionLocal()
     try:
@@ -29,13 +47,13 @@ def build_index_async(job_id: str, taxonomy: str, registry, jobs: JobsManager) -
         tax_repo = TaxonomyRepository(db)
         entry_repo = TaxonomyEntryRepository(db)
 
-        t = tax_repo.get_by_taxonomy(taxonomy)
-        if not t:
+        taxonomy_id = tax_repo.get_id_by_taxonomy(taxonomy)
+        if taxonomy_id is None:
             logger.warning("Taxonomy not found", extra={"job_id": job_id, "taxonomy": taxonomy})
             jobs.update(job_id, status="failed", error=f"Taxonomy '{taxonomy}' not found")
             return None
 
-        total = entry_repo.count_by_taxonomy(t.id)
+        total = entry_repo.count_by_taxonomy(taxonomy_id)
         if total == 0:
             logger.warning("No entries found for taxonomy", extra={"job_id": job_id, "taxonomy": taxonomy})
             jobs.update(job_id, status="failed", error=f"No entries found for taxonomy '{taxonomy}'")
@@ -46,11 +64,14 @@ def build_index_async(job_id: str, taxonomy: str, registry, jobs: JobsManager) -
         logger.info("Index build running", extra={"job_id": job_id, "taxonomy": taxonomy, "total": total, "batch": BATCH})
 
         done = 0
-        vs: Optional[FAISS] = None
-        offset = 0
+        last_progress = 0
+        # one float32 matrix for the whole taxonomy, filled batch by batch and handed to faiss once
+        vectors: Optional[np.ndarray] = None
+        docs: List[Document] = []
 
-        while True:
-            entries = entry_repo.list_by_taxonomy(t.id, offset=offset, limit=BATCH)
+        # page up to the counted total so the preallocated matrix cannot overflow
+        while done < total:
+            entries = entry_repo.list_index_rows(taxonomy_id, offset=done, limit=min(BATCH, total - done))
             if not entries:
                 break
 
@@ -65,30 +86,36 @@ def build_index_async(job_id: str, taxonomy: str, registry, jobs: JobsManager) -
                     "taxonomy": taxonomy
                 })
 
-            vectors = registry.embedder.embed_documents(texts)
-            batch_index = FAISS.from_embeddings(
-                text_embeddings=list(zip(texts, vectors)),
-                embedding=registry.embedder,
-                metadatas=metas,
-            )
-            if vs is None:
-                vs = batch_index
-            else:
-                vs.merge_from(batch_index)
+            batch = registry.embedder.embed_documents(texts)
+            if vectors is None:
+                vectors = np.empty((total, len(batch[0])), dtype=np.float32)
+            vectors[done:done + len(batch)] = batch
+            docs.extend(Document(page_content=t, metadata=m) for t, m in zip(texts, metas))
 
             done += len(entries)
-            offset += len(entries)
-            jobs.update(job_id, done=done, progress=int(done * 100 / total))
+            # at most ~100 job writes (and waiter wakeups) per build, whatever the batch count
+            progress = int(done * 100 / total)
+            if progress != last_progress:
+                jobs.update(job_id, done=done, progress=progress)
+                last_progress = progress
 
-        if vs is None:
+        if vectors is None:
             logger.warning("No documents were indexed", extra={"job_id": job_id, "taxonomy": taxonomy})
             jobs.update(job_id, status="failed", error="No documents were indexed")
             return None
 
-        out_dir = Path(config.index_path) / taxonomy
-        out_dir.mkdir(parents=True, exist_ok=True)
-        vs.save_local(str(out_dir))
+        ids = [str(uuid.uuid4()) for _ in range(done)]
+        vs = FAISS(
+            embedding_function=registry.embedder,
+            index=_build_faiss_index(vectors[:done], config.QUANTIZE_INDEX),
+            docstore=InMemoryDocstore(dict(zip(ids, docs))),
+            index_to_docstore_id=dict(enumerate(ids)),
+        )
+
+        out_dir = index_cache.save(taxonomy, vs)
         index_cache.set(taxonomy, vs)
+        if vectorstore is not None:
+            vectorstore.evict_cached_results(taxonomy)
 
         jobs.update(job_id, status="completed", done=done, total=total)
         logger.info("Index build completed", extra={"job_id": job_id, "taxonomy": taxonomy, "indexed": done, "path": str(out_dir)})
@@ -114,14 +141,13 @@ def finetune_embedder_async(job_id, embedder_id, date_from, date_to, jobs: JobsM
         if not target_embedder or not Path(target_embedder.path).exists():
             raise AppException(ErrorCode.NOT_FOUND, "Embedder not found or path missing", status_code=404)
         
-        # Retrieve feedback within the specified date range
-        feedbacks = feedback_repo.list_filtered(taxonomy_id=None, date_from=date_from, date_to=date_to, pagination=False)
-        
-        # Prepare positive feedback pairs directly for training
-        train_examples = [
-            InputExample(texts=[r.query, r.reference], label=1.0)
-            for r in feedbacks if r.is_correct
-        ]
+        # Stream feedback within the specified date range, keeping only positive pairs for training
+        train_examples = []
+        feedback_count = 0
+        for r in feedback_repo.list_training_rows(date_from=date_from, date_to=date_to):
+            feedback_count += 1
+            if r.is_correct:
+                train_examples.append(InputExample(texts=[r.query, r.reference], label=1.0))
 
         if not train_examples:
             jobs.update(job_id, status="failed", error="No positive feedback pairs for embedder training.")
@@ -165,7 +191,7 @@ def finetune_embedder_async(job_id, embedder_id, date_from, date_to, jobs: JobsM
         db.commit()
         
         # Successfully completed finetuning
-        jobs.update(job_id, status="completed", done=len(train_examples), total=len(feedbacks))
+        jobs.update(job_id, status="completed", done=len(train_examples), total=feedback_count)
         logger.info(f"Finetuning completed for embedder {embedder_id}", extra={"job_id": job_id})
         
     except AppException as e:
@@ -190,18 +216,12 @@ def finetune_reranker_async(job_id, reranker_id, date_from, date_to, jobs: JobsM
         if not target_reranker or not Path(target_reranker.path).exists():
             raise AppException(ErrorCode.NOT_FOUND, "Reranker not found or path missing", status_code=404)
         
-        # Retrieve feedback within the specified date range
-        feedbacks = feedback_repo.list_filtered(taxonomy_id=None, date_from=date_from, date_to=date_to, pagination=False)
-        
-        # Prepare training pairs with both positive and negative feedback pairs
-        train_examples = [
-            InputExample(texts=[r.query, r.reference], label=1.0)  # Positive pairs (label = 1)
-            for r in feedbacks if r.is_correct
-        ]
-        train_examples += [
-            InputExample(texts=[r.query, r.reference], label=0.0)  # Negative pairs (label = 0)
-            for r in feedbacks if not r.is_correct
-        ]
+        # Stream feedback within the specified date range into positive (1) and negative (0) pairs
+        train_examples = []
+        feedback_count = 0
+        for r in feedback_repo.list_training_rows(date_from=date_from, date_to=date_to):
+            feedback_count += 1
+            train_examples.append(InputExample(texts=[r.query, r.reference], label=1.0 if r.is_correct else 0.0))
         
         if not train_examples:
             jobs.update(job_id, status="failed", error="No feedback pairs for reranker training.")
@@ -244,7 +264,7 @@ def finetune_reranker_async(job_id, reranker_id, date_from, date_to, jobs: JobsM
         db.commit()
         
         # Successfully completed finetuning
-        jobs.update(job_id, status="completed", done=len(train_examples), total=len(feedbacks))
+        jobs.update(job_id, status="completed", done=len(train_examples), total=feedback_count)
         logger.info(f"Finetuning completed for reranker {reranker_id}", extra={"job_id": job_id})
         
     except AppException as e:
@@ -1,3 +1,4 @@
+import itertools
 import logging
 import numpy as np
 from pathlib import Path
@@ -18,6 +19,9 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+# process-wide and never reused, unlike id() of a replaced model object
+_MODEL_VERSIONS = itertools.count(1)
+
 
 class SentenceTransformerEmbedder(Embeddings):
     def __init__(self, model):
@@ -66,6 +70,8 @@ class ModelRegistry:
         self.config = get_config()
         self.embedder = None
         self.reranker = None
+        # bumped whenever a new embedder/reranker pair is loaded
+        self.version = 0
 
     def load_models_from_path(self, embedder_dir: Path, reranker_dir: Path) -> None:
         from sentence_transformers import SentenceTransformer, CrossEncoder
@@ -77,6 +83,7 @@ class ModelRegistry:
 
             self.embedder = SentenceTransformerEmbedder(embedder_model)
             self.reranker = CrossEncoderReranker(reranker_model)
+            self.version = next(_MODEL_VERSIONS)
 
             logger.info("Models loaded from local copies.")
         except Exception as e:
@@ -0,0 +1,72 @@
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class _Bucket:
+    """Fixed-size ring of normalized query vectors and their results"""
+
+    def __init__(self, dim: int, size: int, owner: Hashable):
+        self.owner = owner
+        self.vectors = np.zeros((size, dim), dtype=np.float32)
+        self.results: List[Optional[List[Dict[str, Any]]]] = [None] * size
+        self.count = 0
+        self.next = 0
+
+
+class SemanticCache:
+    """Query results reused for near-identical query embeddings (cosine >= threshold).
+
+    Buckets are keyed per (taxonomy, k). Each bucket remembers the index/embedder
+    it was filled against via `owner` and is dropped as soon as that changes.
+    """
+
+    def __init__(self, size: int, threshold: float):
+        self._size = size
+        self._threshold = threshold
+        self._buckets: Dict[Tuple[str, int], _Bucket] = {}
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._size > 0
+
+    def get(self, key: Tuple[str, int], owner: Hashable, vector: Sequence[float]) -> Optional[List[Dict[str, Any]]]:
+        q = _normalize(vector)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.count == 0:
+                return None
+            if bucket.owner != owner or bucket.vectors.shape[1] != q.shape[0]:
+                del self._buckets[key]
+                return None
+            sims = bucket.vectors[:bucket.count] @ q
+            i = int(sims.argmax())
+            return bucket.results[i] if sims[i] >= self._threshold else None
+
+    def put(self, key: Tuple[str, int], owner: Hashable, vector: Sequence[float], results: List[Dict[str, Any]]) -> None:
+        q = _normalize(vector)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.owner != owner or bucket.vectors.shape[1] != q.shape[0]:
+                bucket = self._buckets[key] = _Bucket(q.shape[0], self._size, owner)
+            # overwrite the oldest slot once full
+            bucket.vectors[bucket.next] = q
+            bucket.results[bucket.next] = results
+            bucket.next = (bucket.next + 1) % self._size
+            bucket.count = min(bucket.count + 1, self._size)
+
+    def clear(self, taxonomy: Optional[str] = None) -> None:
+        with self._lock:
+            if taxonomy is None:
+                self._buckets.clear()
+            else:
+                for key in [k for k in self._buckets if k[0] == taxonomy]:
+                    del self._buckets[key]
+
+
+def _normalize(vector: Sequence[float]) -> np.ndarray:
+    q = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(q)
+    return q / norm if norm > 0 else q
@@ -1,11 +1,10 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
 import logging
 
 from app.core.errors import AppException, ErrorCode
 from app.models import Taxonomy, TaxonomyEntry
-from app.repositories import TaxonomyRepository, TaxonomyEntryRepository
-from app.utils import validate_and_parse_excel
+from app.repositories import TaxonomyRepository, TaxonomyEntryRepository, invalidate_taxonomy_cache
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +18,7 @@ class TaxonomyService:
 
     def upload_taxonomy(
         self,
-        file_contents: bytes,
+        rows: Iterable[Tuple[Any, Any, Any]],
         filename: str,
         sheet_name: str,
         taxonomy: str,
@@ -37,21 +36,16 @@ class TaxonomyService:
                 source_file=filename,
             )
 
-            entries = []
-            for row in validate_and_parse_excel(file_contents, sheet_name):
-                entries.append({
-                    "taxonomy_id": t.id,
-                    "tag": row["tag"],
-                    "datatype": row["type"],
-                    "reference": row["reference"],
-                })
-
-            self.entry_repo.bulk_create(entries)
+            entries = self.entry_repo.bulk_insert(
+                {"taxonomy_id": t.id, "tag": tag, "datatype": datatype, "reference": reference}
+                for tag, datatype, reference in rows
+            )
             self.db.commit()
+            invalidate_taxonomy_cache()
 
             logger.info(
                 "Uploaded taxonomy successfully",
-                extra={"taxonomy_id": t.id, "taxonomy": taxonomy, "entries": len(entries)}
+                extra={"taxonomy_id": t.id, "taxonomy": taxonomy, "entries": entries}
             )
             return t.id
 
@@ -65,6 +59,12 @@ class TaxonomyService:
             raise
 
 
+    def list_rows(self) -> List[Dict[str, Any]]:
+        return self.tax_repo.list_rows()
+
+    def list_by_ids(self, taxonomy_ids: List[int]) -> List[Taxonomy]:
+        return self.tax_repo.list_by_ids(taxonomy_ids)
+
     def get_by_taxonomy_name(self, taxonomy: str) -> Optional[Taxonomy]:
         return self.tax_repo.get_by_taxonomy(taxonomy)
 
@@ -74,19 +74,32 @@ class TaxonomyService:
             raise AppException(ErrorCode.NOT_FOUND, "Taxonomy not found", status_code=404)
         return t
 
-    def delete(self, taxonomy_id: int) -> None:
-        t = self.tax_repo.get(taxonomy_id)
-        if not t:
-            raise AppException(ErrorCode.NOT_FOUND, "Taxonomy not found", status_code=404)
+    def delete(self, taxonomy_id: int) -> str:
+        """Delete the taxonomy and return its name"""
         try:
-            self.tax_repo.delete(t)
+            taxonomy = self.tax_repo.delete_by_id(taxonomy_id)
+            if taxonomy is None:
+                raise AppException(ErrorCode.NOT_FOUND, "Taxonomy not found", status_code=404)
             self.db.commit()
         except Exception:
             self.db.rollback()
             raise
+        invalidate_taxonomy_cache()
+        return taxonomy
+
+    def get_entries(
+        self, taxonomy_id: int, offset: int = 0, limit: int = 200, after_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        return self.entry_repo.list_by_taxonomy(taxonomy_id, offset=offset, limit=limit, after_id=after_id)
+
+    def get_entries_for_taxonomies(self, taxonomy_ids: List[int], offset: int = 0, limit: int = 200) -> List[TaxonomyEntry]:
+        return self.entry_repo.list_by_taxonomies(taxonomy_ids, offset=offset, limit=limit)
 
-    def get_entries(self, taxonomy_id: int) -> List[TaxonomyEntry]:
-        return self.entry_repo.list_by_taxonomy(taxonomy_id)
+    def get_entry(self, entry_id: int) -> TaxonomyEntry:
+        entry = self.entry_repo.get(entry_id)
+        if not entry:
+            raise AppException(ErrorCode.NOT_FOUND, "Entry not found", status_code=404)
+        return entry
 
     def add_entry(self, taxonomy_id: int, tag: str, datatype: str, reference: str) -> TaxonomyEntry:
         try:
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Tuple, Dict, Any
 import logging
 from langchain.schema import Document
@@ -7,6 +8,8 @@ from app.core.config import get_config
 from app.core.errors import AppException, ErrorCode
 from app.core.index_cache import index_cache
 from app.services.model_registry import ModelRegistry
+from app.services.embed_batcher import EmbedBatcher
+from app.services.semantic_cache import SemanticCache
 from app.utils import warm_taxonomy
 
 logger = logging.getLogger(__name__)
@@ -15,6 +18,8 @@ class VectorstoreService:
     def __init__(self):
         self.config = get_config()
         self._embed_dim = None
+        self._semantic_cache = SemanticCache(self.config.SEMANTIC_CACHE_SIZE, self.config.SEMANTIC_CACHE_THRESHOLD)
+        self._embed_batcher = EmbedBatcher(self.config.EMBED_BATCH_MAX, self.config.EMBED_BATCH_WAIT_MS)
 
     def load_index(self, taxonomy: str, embeddings) -> FAISS:
         vectorstore = index_cache.get(taxonomy, embeddings)
@@ -49,8 +54,8 @@ class VectorstoreService:
                 status_code=409,
             )
 
-    def _perform_similarity_search(self, vectorstore: FAISS, query: str, k: int):
-        return vectorstore.similarity_search_with_score(query, k=k)
+    def _perform_similarity_search(self, vectorstore: FAISS, query_vector: List[float], k: int):
+        return vectorstore.similarity_search_with_score_by_vector(query_vector, k=k)
 
     def _format_search_results(self, docs_with_scores: List[Tuple[Document, float]], use_rerank_score: bool = False):
         results = []
@@ -73,6 +78,12 @@ class VectorstoreService:
 
     def query(self, req, registry) -> Tuple[str, str, List[Dict[str, Any]]]:
         logger.info("Vector query", extra={"taxonomy": req.taxonomy, "k": req.k, "rerank": req.rerank})
+        # Cached results are only valid for the exact index and embedder that produced them. Read the
+        # version before loading: if the index is swapped in between, entries land under the old one.
+        # Rerank scores depend on the query text itself, not just its embedding, so those are never cached.
+        use_cache = self._semantic_cache.enabled and not req.rerank
+        cache_key = (req.taxonomy, req.k)
+        cache_owner = (index_cache.version(req.taxonomy), registry.version)
         try:
             vectorstore = self.load_index(req.taxonomy, registry.embedder)
         except Exception as e:
@@ -87,8 +98,16 @@ class VectorstoreService:
             )
 
         self._validate_embedding_compatibility(vectorstore, registry.embedder)
+        query_vector = self._embed_batcher.embed_query(registry.embedder, req.query)
+
+        if use_cache:
+            cached = self._semantic_cache.get(cache_key, cache_owner, query_vector)
+            if cached is not None:
+                logger.info("Vector query served from semantic cache", extra={"taxonomy": req.taxonomy})
+                return req.query, req.taxonomy, cached
+
         k_search = max(req.k * 5, req.k) if req.rerank else req.k
-        docs_with_scores = self._perform_similarity_search(vectorstore, req.query, k_search)
+        docs_with_scores = self._perform_similarity_search(vectorstore, query_vector, k_search)
 
         if req.rerank:
             reranked_results = self._apply_reranking(req.query, docs_with_scores, registry.reranker, req.k)
@@ -97,13 +116,24 @@ class VectorstoreService:
             limited_results = docs_with_scores[:req.k]
             results = self._format_search_results(limited_results, use_rerank_score=False)
 
+        if use_cache:
+            self._semantic_cache.put(cache_key, cache_owner, query_vector, results)
         logger.info("Vector query completed", extra={"taxonomy": req.taxonomy, "returned": len(results)})
         return req.query, req.taxonomy, results
 
+    def evict_cached_results(self, taxonomy: str) -> None:
+        self._semantic_cache.clear(taxonomy)
+
     def warm_all_disk_indices(self, registry: ModelRegistry):
         taxes = index_cache.disk_indices
-        for tax in taxes:
-            try:
-                warm_taxonomy(tax, registry)
-            except Exception as e:
-                logger.warning("Warmup skipped for taxonomy", extra={"taxonomy": tax, "error": str(e)})
+        if not taxes:
+            return
+        # index loads are mostly disk I/O and torch/FAISS release the GIL, so overlap them
+        with ThreadPoolExecutor(max_workers=min(8, len(taxes)), thread_name_prefix="warmup") as ex:
+            futures = {ex.submit(warm_taxonomy, tax, registry): tax for tax in taxes}
+            for fut in as_completed(futures):
+                tax = futures[fut]
+                try:
+                    fut.result()
+                except Exception as e:
+                    logger.warning("Warmup skipped for taxonomy", extra={"taxonomy": tax, "error": str(e)})
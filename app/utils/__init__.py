@@ -1,10 +1,22 @@
-from .validate_and_parse_excel import validate_and_parse_excel
+from .validate_and_parse_excel import validate_and_parse_excel, parse_excel_rows
 from .copy_dir import copy_dir
-from .warm_taxonomy import warm_taxonomy
+from .parse_pool import get_parse_pool, shutdown_parse_pool
 
 __all__ = [
     "validate_and_parse_excel",
+    "parse_excel_rows",
     "warm_taxonomy",
     "copy_dir",
+    "get_parse_pool",
+    "shutdown_parse_pool",
     
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Imported on first use: it pulls in torch via the model registry, which spawned
+    # parse workers (they only need the Excel parser) should not pay for
+    if name == "warm_taxonomy":
+        from .warm_taxonomy import warm_taxonomy
+        return warm_taxonomy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,7 +1,18 @@
+import os
 import shutil
 from pathlib import Path
 
 
+def _link_or_copy(src: str, dst: str) -> str:
+    # Same filesystem: hardlink (metadata only). Across mounts (e.g. gcsfuse -> /tmp) os.link
+    # fails with EXDEV and we fall back to a byte copy.
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 def copy_dir(src: Path, dst: Path) -> None:
     if not src.exists():
         raise FileNotFoundError(f"Active model path not found: {src}")
@@ -15,4 +26,4 @@ def copy_dir(src: Path, dst: Path) -> None:
             else:
                 item.unlink()
 
-    shutil.copytree(src, dst, dirs_exist_ok=True)
+    shutil.copytree(src, dst, copy_function=_link_or_copy, dirs_exist_ok=True)
@@ -0,0 +1,25 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import Optional
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_LOCK = Lock()
+
+
+def get_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        with _LOCK:
+            if _POOL is None:
+                # spawn rather than fork: a forked child would inherit torch/faiss thread state mid-lock
+                _POOL = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+    return _POOL
+
+
+def shutdown_parse_pool() -> None:
+    global _POOL
+    with _LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
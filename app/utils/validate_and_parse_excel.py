@@ -1,20 +1,26 @@
-from io import BytesIO
-from typing import Iterable
+from typing import Any, BinaryIO, Iterable, List, Sequence, Tuple
 from openpyxl import load_workbook
 from app.core.errors import AppException, ErrorCode
 
+try:
+    # Rust-backed reader; far cheaper than openpyxl's per-cell objects on large sheets
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
 REQUIRED_COLS = {"tag", "type", "reference"}
 
-def validate_and_parse_excel(contents: bytes, sheet_name: str) -> Iterable[dict]:
-    wb = load_workbook(BytesIO(contents), read_only=True)
-    if sheet_name not in wb.sheetnames:
+def validate_and_parse_excel(source: BinaryIO, sheet_name: str) -> Iterable[Tuple[Any, Any, Any]]:
+    """Yield (tag, type, reference) per data row"""
+    sheet_names, rows = _open_sheet(source, sheet_name)
+    if rows is None:
         raise AppException(
             ErrorCode.FILE_VALIDATION_ERROR,
-            f"Sheet '{sheet_name}' not found. Available: {wb.sheetnames}",
+            f"Sheet '{sheet_name}' not found. Available: {sheet_names}",
             status_code=400,
         )
-    ws = wb[sheet_name]
-    headers = [str(cell.value).strip().lower() if cell.value else "" for cell in next(ws.iter_rows(min_row=1, max_row=1))]
+    header_row = next(rows, ())
+    headers = [str(value).strip().lower() if value else "" for value in header_row]
     missing = REQUIRED_COLS - set(headers)
     if missing:
         raise AppException(
@@ -23,9 +29,38 @@ def validate_and_parse_excel(contents: bytes, sheet_name: str) -> Iterable[dict]
             status_code=400,
         )
     col_idx = {header: idx for idx, header in enumerate(headers)}
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        yield {
-            "tag": row[col_idx["tag"]],
-            "type": row[col_idx["type"]],
-            "reference": row[col_idx["reference"]],
-        }
\ No newline at end of file
+    tag_i, type_i, ref_i = col_idx["tag"], col_idx["type"], col_idx["reference"]
+    for row in rows:
+        yield _cell(row, tag_i), _cell(row, type_i), _cell(row, ref_i)
+
+
+def parse_excel_rows(path: str, sheet_name: str) -> List[Tuple[Any, Any, Any]]:
+    """Fully parsed rows; top-level with picklable args/result so it can run in a worker process"""
+    with open(path, "rb") as f:
+        return list(validate_and_parse_excel(f, sheet_name))
+
+
+def _open_sheet(source: BinaryIO, sheet_name: str):
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_filelike(source)
+        if sheet_name not in wb.sheet_names:
+            return wb.sheet_names, None
+        return wb.sheet_names, iter(wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=True))
+
+    wb = load_workbook(source, read_only=True, data_only=True)
+    if sheet_name not in wb.sheetnames:
+        return wb.sheetnames, None
+    return wb.sheetnames, wb[sheet_name].iter_rows(values_only=True)
+
+
+def _cell(row: Sequence[Any], idx: int) -> Any:
+    # calamine reports blanks as "" where openpyxl gives None, and whole numbers as floats
+    # where openpyxl gives ints; normalize both so stored values don't depend on the parser
+    if idx >= len(row):
+        return None
+    value = row[idx]
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
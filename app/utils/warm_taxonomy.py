@@ -4,8 +4,10 @@ from app.core.index_cache import index_cache
 
 
 def warm_taxonomy(taxonomy: str, registry: ModelRegistry) -> None:
-    # force load taxonomy
-    vs = index_cache.load(taxonomy, registry.embedder, force_reload=True)
+    # Reuse an already-loaded index rather than re-reading it from disk; only the
+    # embedder may have changed (e.g. /reload_models), so rebind it
+    vs = index_cache.load(taxonomy, registry.embedder)
+    vs.embedding_function = registry.embedder
     
     # Ensure first encode path is hot
     _ = registry.embedder.embed_query("warmup")
@@ -0,0 +1,18 @@
+import os
+import tempfile
+
+# Config requires these at import time; tests never touch a real DB, HF or Gemini
+_STORAGE = tempfile.mkdtemp(prefix="xbrl-tag-tests-")
+for key, value in {
+    "HF_TOKEN": "test",
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "DB_HOST": "localhost",
+    "DB_NAME": "test",
+    "BASE_MODEL_NAME": "test",
+    "BASE_RERANKER_MODEL_NAME": "test",
+    "GEMINI_API_KEY": "test",
+    "MOUNTED_STORAGE_PATH": _STORAGE,
+    "RUNTIME_STORAGE_PATH": _STORAGE,
+}.items():
+    os.environ.setdefault(key, value)
@@ -0,0 +1,68 @@
+import hashlib
+from pathlib import Path
+from typing import List
+
+from langchain.schema import Document
+from langchain_community.vectorstores import FAISS
+
+from app.core.config import get_config
+from app.core.index_cache import IndexCache
+
+DIM = 8
+
+
+class _HashEmbedder:
+    """Deterministic stand-in for the sentence-transformers embedder"""
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        digest = hashlib.sha256(text.encode()).digest()
+        return [b / 255.0 for b in digest[:DIM]]
+
+
+def _cache(tmp_path, mmap: bool) -> IndexCache:
+    cache = IndexCache()
+    cache._config = get_config().model_copy(update={"INDEX_MMAP": mmap, "MOUNTED_STORAGE_PATH": tmp_path})
+    return cache
+
+
+def _seed(cache: IndexCache, taxonomy: str, embedder) -> None:
+    texts = ["alpha", "beta", "gamma"]
+    vs = FAISS.from_embeddings(
+        list(zip(texts, embedder.embed_documents(texts))),
+        embedder,
+        metadatas=[{"tag": t} for t in texts],
+    )
+    cache.save(taxonomy, vs)
+    # drop the in-memory copy so the next access reads the files back
+    cache.remove(taxonomy)
+
+
+def test_update_appends_to_mmap_loaded_index(tmp_path):
+    embedder = _HashEmbedder()
+    cache = _cache(tmp_path, mmap=True)
+    _seed(cache, "esrs", embedder)
+
+    vs = cache.update("esrs", [Document(page_content="delta", metadata={"tag": "delta"})], embedder)
+
+    assert vs.index.ntotal == 4
+    reloaded = _cache(tmp_path, mmap=True).load("esrs", embedder)
+    assert reloaded.index.ntotal == 4
+    doc, _ = reloaded.similarity_search_with_score_by_vector(embedder.embed_query("delta"), k=1)[0]
+    assert doc.metadata["tag"] == "delta"
+
+
+def test_load_restores_index_left_behind_by_interrupted_save(tmp_path):
+    embedder = _HashEmbedder()
+    cache = _cache(tmp_path, mmap=False)
+    _seed(cache, "esrs", embedder)
+    live = Path(cache._config.index_path) / "esrs"
+    # crash after the live dir was moved aside but before the new one was swapped in
+    live.rename(live.parent / ".esrs.old")
+
+    fresh = _cache(tmp_path, mmap=False)
+    assert fresh.disk_indices == ["esrs"]
+    assert fresh.load("esrs", embedder).index.ntotal == 3
+    assert live.is_dir() and not (live.parent / ".esrs.old").exists()
@@ -0,0 +1,39 @@
+import importlib
+
+from openpyxl import Workbook
+
+# the package re-exports the function under the module's name, so fetch the module itself
+parse_module = importlib.import_module("app.utils.validate_and_parse_excel")
+
+
+def _workbook(path):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Tags"
+    ws.append(["Tag", "Type", "Reference"])
+    ws.append([12, "monetary", "ESRS E1-6 44"])
+    ws.append(["esrs:Scope1", "decimal", 3.5])
+    ws.append(["esrs:Scope2", None, 2024])
+    wb.save(path)
+
+
+def _parse(path, monkeypatch, calamine: bool):
+    if not calamine:
+        monkeypatch.setattr(parse_module, "CalamineWorkbook", None)
+    with open(path, "rb") as f:
+        return list(parse_module.validate_and_parse_excel(f, "Tags"))
+
+
+def test_calamine_and_openpyxl_parse_identically(tmp_path, monkeypatch):
+    path = tmp_path / "taxonomy.xlsx"
+    _workbook(path)
+
+    with_calamine = _parse(path, monkeypatch, calamine=True)
+    with_openpyxl = _parse(path, monkeypatch, calamine=False)
+
+    assert with_calamine == with_openpyxl == [
+        (12, "monetary", "ESRS E1-6 44"),
+        ("esrs:Scope1", "decimal", 3.5),
+        ("esrs:Scope2", None, 2024),
+    ]
+    assert all(type(a) is type(b) for ra, rb in zip(with_calamine, with_openpyxl) for a, b in zip(ra, rb))